@@ -10,6 +10,7 @@ from rich.table import Table
 
 from t2d_kit.models.user_recipe import UserRecipe
 from t2d_kit.models.processed_recipe import ProcessedRecipe
+from t2d_kit.utils.yaml_io import safe_load
 from pydantic import ValidationError
 
 console = Console()
@@ -103,7 +104,7 @@ def load(name, type, json_output):
 
     try:
         with open(recipe_path) as f:
-            data = yaml.safe_load(f)
+            data = safe_load(f)
 
         # Validate with Pydantic
         recipe = model_class.model_validate(data)
@@ -145,25 +146,32 @@ def save(name, type, data, force):
     else:
         data_str = data
 
+    model_class = UserRecipe if type == "user" else ProcessedRecipe
+
+    # Try JSON first, parsed and validated in one pass by pydantic, then YAML
+    recipe = None
     try:
-        # Try JSON first, then YAML
+        recipe = model_class.model_validate_json(data_str)
+    except ValidationError as e:
+        if not any(err["type"] == "json_invalid" for err in e.errors()):
+            console.print(f"[red]Validation error:[/red] {str(e)}")
+            sys.exit(1)
+
+    if recipe is None:
         try:
-            recipe_data = json.loads(data_str)
-        except json.JSONDecodeError:
-            recipe_data = yaml.safe_load(data_str)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] Invalid data format: {e}")
-        sys.exit(1)
+            recipe_data = safe_load(data_str)
+        except Exception as e:
+            console.print(f"[red]Error:[/red] Invalid data format: {e}")
+            sys.exit(1)
 
     # Validate and save based on type
     try:
+        if recipe is None:
+            recipe = model_class.model_validate(recipe_data)
+        recipe.name = name
         if type == "user":
-            recipe = UserRecipe.model_validate(recipe_data)
-            recipe.name = name
             recipe_path = USER_RECIPES_DIR / f"{name}.yaml"
         else:
-            recipe = ProcessedRecipe.model_validate(recipe_data)
-            recipe.name = name
             recipe_path = PROCESSED_RECIPES_DIR / f"{name}.t2d.yaml"
 
         # Create backup if file exists
@@ -266,7 +274,7 @@ def validate(name, type, json_output):
     # Validate based on type
     try:
         with open(recipe_path) as f:
-            data = yaml.safe_load(f)
+            data = safe_load(f)
 
         if type == "user":
             recipe = UserRecipe.model_validate(data)
@@ -98,7 +98,7 @@ def verify_command(verbose: bool):
     if shutil.which("d2"):
         try:
             from t2d_kit.utils.d2_utils import is_tala_installed
-            if is_tala_installed():
+            if is_tala_installed(refresh=True):
                 results.append(("D2 Tala Layout", True, "installed (optimal for architecture)"))
             else:
                 results.append(("D2 Tala Layout", False, "not installed (optional)"))
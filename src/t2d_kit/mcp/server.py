@@ -1,6 +1,9 @@
 """T2D Kit MCP Server - Provides schema and documentation resources for Claude Code agents."""
 
+from functools import lru_cache
+
 from fastmcp import FastMCP
+from pydantic import BaseModel
 
 from t2d_kit.models.user_recipe import UserRecipe
 from t2d_kit.models.processed_recipe import ProcessedRecipe
@@ -13,6 +16,15 @@ from t2d_kit.utils.schema_formatter import (
 mcp = FastMCP("t2d-kit")
 
 
+@lru_cache(maxsize=None)
+def _schema_docs(model: type[BaseModel], agent_friendly: bool = False) -> str:
+    """Render a model's schema documentation once; models don't change at runtime."""
+    schema = model.model_json_schema()
+    if agent_friendly:
+        return format_schema_agent_friendly(schema, model.__name__)
+    return format_schema_markdown(schema, model.__name__)
+
+
 # ============================================================================
 # Schema Resources
 # ============================================================================
@@ -44,8 +56,7 @@ def get_user_recipe_schema_agent() -> str:
 
     Optimized for Claude Code agents to quickly understand the schema structure.
     """
-    schema = UserRecipe.model_json_schema()
-    return format_schema_agent_friendly(schema, "UserRecipe")
+    return _schema_docs(UserRecipe, agent_friendly=True)
 
 
 @mcp.resource("recipe://schema/processed/agent-friendly", mime_type="text/plain")
@@ -54,8 +65,7 @@ def get_processed_recipe_schema_agent() -> str:
 
     Optimized for Claude Code agents to quickly understand the schema structure.
     """
-    schema = ProcessedRecipe.model_json_schema()
-    return format_schema_agent_friendly(schema, "ProcessedRecipe")
+    return _schema_docs(ProcessedRecipe, agent_friendly=True)
 
 
 # ============================================================================
@@ -71,8 +81,7 @@ def get_user_recipe_docs() -> str:
     It combines schema information, field descriptions, validation rules, and
     practical examples in a single comprehensive document.
     """
-    schema = UserRecipe.model_json_schema()
-    return format_schema_markdown(schema, "UserRecipe")
+    return _schema_docs(UserRecipe)
 
 
 @mcp.resource("recipe://docs/processed-recipe", mime_type="text/markdown")
@@ -83,8 +92,7 @@ def get_processed_recipe_docs() -> str:
     It combines schema information, field descriptions, validation rules, and
     practical examples in a single comprehensive document.
     """
-    schema = ProcessedRecipe.model_json_schema()
-    return format_schema_markdown(schema, "ProcessedRecipe")
+    return _schema_docs(ProcessedRecipe)
 
 
 @mcp.resource("recipe://docs/quick-start", mime_type="text/markdown")
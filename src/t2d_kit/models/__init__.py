@@ -6,6 +6,7 @@ All models inherit from T2DBaseModel with enhanced validation.
 
 # Base model and common types
 from .base import (
+    CaseInsensitive,
     ContentField,
     ContentType,
     DescriptionField,
@@ -60,6 +61,7 @@ from .mkdocs_config import (
 
 # Processed recipe models
 from .processed_recipe import (
+    ActualPaths,
     DiagramReference,
     OutputConfig,
     ProcessedRecipe,
@@ -100,6 +102,7 @@ __all__ = [
     "PositiveIntField",
     "NonNegativeIntField",
     "ScoreField",
+    "CaseInsensitive",
     "DiagramType",
     "FrameworkType",
     "OutputFormat",
@@ -120,6 +123,7 @@ __all__ = [
     # Processed recipe models
     "ProcessedRecipe",
     "DiagramReference",
+    "ActualPaths",
     "OutputConfig",
     # Diagram models
     "DiagramSpecification",
@@ -1,9 +1,9 @@
 """T015: Base model and common type annotations for T2D-Kit models."""
 
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 
 class T2DBaseModel(BaseModel):
@@ -11,7 +11,7 @@ class T2DBaseModel(BaseModel):
 
     model_config = ConfigDict(
         extra="forbid",  # No unexpected fields
-        validate_assignment=True,  # Validate on assignment
+        validate_assignment=True,  # Validate on assignment (helper-mutated configs opt out)
         str_strip_whitespace=True,  # Auto-strip strings
         frozen=False,  # Allow mutations (most models need this)
         use_enum_values=True,  # Use enum values in JSON
@@ -69,6 +69,16 @@ NonNegativeIntField = Annotated[int, Field(ge=0, description="Non-negative integ
 ScoreField = Annotated[float, Field(ge=0.0, le=1.0, description="Score between 0.0 and 1.0")]
 
 
+def _lowercase(value: Any) -> Any:
+    return value.lower() if isinstance(value, str) else value
+
+
+# Lowercases string input before validation; use on all-lowercase Literal
+# fields, e.g. ``Annotated[Literal["a", "b"], CaseInsensitive]``, so values
+# are normalized once at ingest instead of at every comparison.
+CaseInsensitive = BeforeValidator(_lowercase)
+
+
 # Common Enums
 class DiagramType(str, Enum):
     """Comprehensive diagram types supporting all major frameworks."""
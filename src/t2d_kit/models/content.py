@@ -3,14 +3,28 @@
 from datetime import datetime
 from pathlib import Path
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, field_validator
 
-from .base import ContentType, InstructionsField, NameField, PathField, T2DBaseModel
+from .base import (
+    ContentType,
+    InstructionsField,
+    NameField,
+    PathField,
+    T2DBaseModel,
+)
+
+_CONTENT_AGENTS = frozenset(
+    {"t2d-mkdocs-generator", "t2d-zudoku-generator", "t2d-slides-generator"}
+)
+_MARKDOWN_SUFFIXES = frozenset({".md", ".markdown"})
 
 
 class ContentFile(T2DBaseModel):
     """Markdown files maintained by Claude Code agents."""
 
+    # Schema is built on first use instead of at import time
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(pattern=r"^[a-zA-Z0-9_-]+$", min_length=1, max_length=100)
     path: PathField
     type: ContentType
@@ -18,29 +32,14 @@ class ContentFile(T2DBaseModel):
     base_prompt: InstructionsField
     diagram_refs: list[str] = Field(default_factory=list)
     title: NameField | None = None
-    last_updated: datetime | str
-
-    @field_validator("last_updated")
-    @classmethod
-    def validate_last_updated(cls, v: datetime | str) -> datetime:
-        """Convert string to datetime if needed."""
-        if isinstance(v, str):
-            try:
-                # Handle ISO format with Z suffix
-                if v.endswith("Z"):
-                    v = v[:-1] + "+00:00"
-                from datetime import timezone
-                v = datetime.fromisoformat(v)
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Invalid datetime format: {v}") from e
-        return v
+    last_updated: datetime
 
     @field_validator("path")
     @classmethod
     def validate_markdown_extension(cls, v: str) -> str:
         """Ensure content files are markdown."""
         path = Path(v)
-        if path.suffix not in {".md", ".markdown"}:
+        if path.suffix not in _MARKDOWN_SUFFIXES:
             raise ValueError("Content files must be markdown (.md or .markdown)")
         return v
 
@@ -48,9 +47,8 @@ class ContentFile(T2DBaseModel):
     @classmethod
     def validate_agent_type(cls, v: str) -> str:
         """Ensure agent is a valid content agent."""
-        valid_agents = {"t2d-mkdocs-generator", "t2d-zudoku-generator", "t2d-slides-generator"}
-        if v not in valid_agents:
-            raise ValueError(f"Agent must be one of: {valid_agents}")
+        if v not in _CONTENT_AGENTS:
+            raise ValueError(f"Agent must be one of: {sorted(_CONTENT_AGENTS)}")
         return v
 
     @field_validator("base_prompt")
@@ -85,9 +83,9 @@ Guidelines:
 
         context_lines = []
         for ref in diagram_references:
-            if ref.status == "generated" and ref.actual_paths:
-                context_lines.append(f"- {ref.id}: {ref.title} ({ref.type.value})")
-                for format_type, path in ref.actual_paths.items():
+            if ref.status == "generated" and ref.actual_paths and ref.actual_paths.has_any():
+                context_lines.append(f"- {ref.id}: {ref.title} ({ref.type})")
+                for format_type, path in ref.actual_paths.model_dump(exclude_none=True).items():
                     context_lines.append(f"  - {format_type.upper()}: {path}")
                 if ref.description:
                     context_lines.append(f"  - Description: {ref.description}")
@@ -99,6 +97,3 @@ Guidelines:
 
 # Import here to avoid circular imports
 from .processed_recipe import DiagramReference
-
-# Update forward references
-ContentFile.model_rebuild()
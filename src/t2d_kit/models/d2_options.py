@@ -1,18 +1,18 @@
 """T021: D2Options model for advanced D2 diagram configuration."""
 
 import warnings
-from typing import Any, Literal, Optional
+from typing import Annotated, Any, Literal, Optional
 
 from pydantic import Field, field_validator, model_validator
 
-from .base import T2DBaseModel
+from .base import CaseInsensitive, T2DBaseModel
 
 
 class D2Options(T2DBaseModel):
     """Advanced D2 diagram configuration options."""
 
     # Layout engines
-    layout_engine: Literal["dagre", "elk", "tala"] | None = Field(
+    layout_engine: Annotated[Literal["dagre", "elk", "tala"] | None, CaseInsensitive] = Field(
         default=None, description="D2 layout engine to use (auto-detect if None)"
     )
 
@@ -58,7 +58,7 @@ class D2Options(T2DBaseModel):
     )
 
     # Advanced layout options
-    direction: Literal["up", "down", "right", "left"] = Field(
+    direction: Annotated[Literal["up", "down", "right", "left"], CaseInsensitive] = Field(
         default="down", description="Primary direction for layout flow"
     )
 
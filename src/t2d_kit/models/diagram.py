@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any, Union
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import ConfigDict, Field, field_validator, model_validator
 
 from .base import (
     DiagramType,
@@ -15,10 +15,15 @@ from .base import (
     T2DBaseModel,
 )
 
+_DIAGRAM_SOURCE_SUFFIXES = frozenset({".d2", ".mmd", ".puml", ".gv", ".md"})
+
 
 class DiagramSpecification(T2DBaseModel):
     """Individual diagram definition with generator agent prompt."""
 
+    # Forward refs are resolved on first use instead of at import time
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(pattern=r"^[a-zA-Z0-9_-]+$", min_length=1, max_length=100)
     type: DiagramType
     framework: FrameworkType | None = None
@@ -42,9 +47,10 @@ class DiagramSpecification(T2DBaseModel):
     def validate_output_file_extension(cls, v: str) -> str:
         """Ensure output file has appropriate extension."""
         path = Path(v)
-        valid_extensions = {".d2", ".mmd", ".puml", ".gv", ".md"}
-        if path.suffix not in valid_extensions:
-            raise ValueError(f"Output file must have extension: {valid_extensions}")
+        if path.suffix not in _DIAGRAM_SOURCE_SUFFIXES:
+            raise ValueError(
+                f"Output file must have extension: {sorted(_DIAGRAM_SOURCE_SUFFIXES)}"
+            )
         return v
 
     @model_validator(mode="after")
@@ -234,6 +240,3 @@ class DiagramSpecification(T2DBaseModel):
 from .d2_options import D2Options
 from .marp_config import MarpConfig
 from .mermaid_config import MermaidConfig
-
-# Update forward references
-DiagramSpecification.model_rebuild()
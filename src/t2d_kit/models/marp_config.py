@@ -1,22 +1,48 @@
 """T024: MarpConfig model for advanced Marp presentation configuration."""
 
+import io
 from pathlib import Path
-from typing import Any, Literal
+from types import MappingProxyType
+from typing import IO, Annotated, Any, Literal
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field
 
-from .base import T2DBaseModel
+from .base import CaseInsensitive, T2DBaseModel
+
+# Per-theme defaults applied by MarpConfig.apply_theme_defaults
+_THEME_DEFAULTS = MappingProxyType(
+    {
+        "gaia": MappingProxyType(
+            {
+                "font_family": "'Avenir Next', 'Hiragino Kaku Gothic ProN', 'Meiryo', sans-serif",
+                "background_color": "#fafafa",
+            }
+        ),
+        "uncover": MappingProxyType(
+            {
+                "font_family": "'Liberation Sans', 'Hiragino Sans', sans-serif",
+                "background_color": "#ffffff",
+            }
+        ),
+        "default": MappingProxyType({"font_family": "'Helvetica Neue', Arial, sans-serif"}),
+    }
+)
 
 
 class MarpConfig(T2DBaseModel):
     """Advanced Marp presentation configuration with directives and exports."""
 
+    model_config = ConfigDict(validate_assignment=False)
+
     # Theme configuration
-    theme: Literal[
-        "default",
-        "gaia",
-        "uncover",
-        # Custom themes can be added
+    theme: Annotated[
+        Literal[
+            "default",
+            "gaia",
+            "uncover",
+            # Custom themes can be added
+        ],
+        CaseInsensitive,
     ] = Field(default="default", description="Marp theme to apply")
 
     custom_theme_path: Path | None = Field(
@@ -45,7 +71,7 @@ class MarpConfig(T2DBaseModel):
         default=None, description="URL or path to background image"
     )
 
-    background_size: Literal["cover", "contain", "auto", "fit"] = Field(
+    background_size: Annotated[Literal["cover", "contain", "auto", "fit"], CaseInsensitive] = Field(
         default="cover", description="Background image sizing"
     )
 
@@ -63,11 +89,12 @@ class MarpConfig(T2DBaseModel):
     )
 
     # Transition effects (for HTML export)
-    transition: Literal["none", "fade", "slide", "convex", "concave", "zoom", "linear"] | None = (
-        Field(default=None, description="Slide transition effect for HTML export")
-    )
+    transition: Annotated[
+        Literal["none", "fade", "slide", "convex", "concave", "zoom", "linear"] | None,
+        CaseInsensitive,
+    ] = Field(default=None, description="Slide transition effect for HTML export")
 
-    transition_speed: Literal["slow", "default", "fast"] = Field(
+    transition_speed: Annotated[Literal["slow", "default", "fast"], CaseInsensitive] = Field(
         default="default", description="Transition speed"
     )
 
@@ -81,7 +108,7 @@ class MarpConfig(T2DBaseModel):
     )
 
     # Advanced features
-    math: Literal["katex", "mathjax", None] = Field(
+    math: Annotated[Literal["katex", "mathjax", None], CaseInsensitive] = Field(
         default="katex", description="Math rendering engine"
     )
 
@@ -99,67 +126,80 @@ class MarpConfig(T2DBaseModel):
     # Speaker notes
     notes: bool = Field(default=True, description="Enable speaker notes")
 
-    @field_validator("custom_theme_path")
-    @classmethod
-    def validate_theme_exists(cls, v: Path | None) -> Path | None:
-        """Check if custom theme file exists."""
-        if v and not v.exists():
-            raise ValueError(f"Custom theme file not found: {v}")
-        return v
-
     def to_frontmatter(self) -> str:
         """Generate Marp frontmatter for markdown file."""
-        fm = ["---"]
+        buf = io.StringIO()
+        self.write_frontmatter(buf)
+        return buf.getvalue()
+
+    def write_frontmatter(self, fp: IO[str]) -> None:
+        """Write Marp frontmatter line by line to a text stream.
+
+        Lets callers stream a deck straight to disk without materializing the
+        frontmatter string first::
+
+            with open(path, "w") as f:
+                config.write_frontmatter(f)
+                f.write(body)
+        """
+        # Read every field once from the instance dict instead of going through
+        # attribute access for each check below.
+        d = self.__dict__
+        font_family = d["font_family"]
+        font_size = d["font_size"]
+        style = d["style"]
+
+        write = fp.write
+        write("---\n")
 
         # Core directives
-        fm.append(f"marp: {str(self.marp).lower()}")
-        fm.append(f"theme: {self.theme}")
-        fm.append(f"size: {self.size}")
-        fm.append(f"paginate: {str(self.paginate).lower()}")
+        write(f"marp: {str(d['marp']).lower()}\n")
+        write(f"theme: {d['theme']}\n")
+        write(f"size: {d['size']}\n")
+        write(f"paginate: {str(d['paginate']).lower()}\n")
 
         # Optional directives
-        if self.header:
-            fm.append(f"header: '{self.header}'")
-        if self.footer:
-            fm.append(f"footer: '{self.footer}'")
-        if self.background_color:
-            fm.append(f"backgroundColor: {self.background_color}")
-        if self.background_image:
-            fm.append(f"backgroundImage: url('{self.background_image}')")
-        if self.background_size:
-            fm.append(f"backgroundSize: {self.background_size}")
-        if self.color:
-            fm.append(f"color: {self.color}")
-        if self.class_:
-            fm.append(f"class: {self.class_}")
-        if self.math:
-            fm.append(f"math: {self.math}")
+        if header := d["header"]:
+            write(f"header: '{header}'\n")
+        if footer := d["footer"]:
+            write(f"footer: '{footer}'\n")
+        if background_color := d["background_color"]:
+            write(f"backgroundColor: {background_color}\n")
+        if background_image := d["background_image"]:
+            write(f"backgroundImage: url('{background_image}')\n")
+        if background_size := d["background_size"]:
+            write(f"backgroundSize: {background_size}\n")
+        if color := d["color"]:
+            write(f"color: {color}\n")
+        if class_ := d["class_"]:
+            write(f"class: {class_}\n")
+        if math := d["math"]:
+            write(f"math: {math}\n")
 
         # Style block
-        if self.style or self.font_family or self.font_size:
-            fm.append("style: |")
-            if self.font_family or self.font_size:
-                fm.append("  section {")
-                if self.font_family:
-                    fm.append(f"    font-family: {self.font_family};")
-                if self.font_size:
-                    fm.append(f"    font-size: {self.font_size};")
-                fm.append("  }")
-            if self.style:
-                for line in self.style.strip().split("\n"):
-                    fm.append(f"  {line}")
-
-        fm.append("---")
-        fm.append("")  # Empty line after frontmatter
-
-        return "\n".join(fm)
+        if style or font_family or font_size:
+            write("style: |\n")
+            if font_family or font_size:
+                write("  section {\n")
+                if font_family:
+                    write(f"    font-family: {font_family};\n")
+                if font_size:
+                    write(f"    font-size: {font_size};\n")
+                write("  }\n")
+            if style:
+                for line in style.strip().split("\n"):
+                    write(f"  {line}\n")
+
+        write("---\n")
 
     def to_cli_args(self) -> list[str]:
         """Convert to Marp CLI arguments."""
         args = []
 
-        # Theme
+        # Theme; the custom theme file is only checked here, when it is consumed
         if self.custom_theme_path:
+            if not self.custom_theme_path.exists():
+                raise FileNotFoundError(f"Custom theme file not found: {self.custom_theme_path}")
             args.extend(["--theme", str(self.custom_theme_path)])
         elif self.theme != "default":
             args.extend(["--theme", self.theme])
@@ -224,24 +264,15 @@ class MarpConfig(T2DBaseModel):
 
     def apply_theme_defaults(self, theme_name: str) -> None:
         """Apply default settings for specific themes."""
-        theme_defaults = {
-            "gaia": {
-                "font_family": "'Avenir Next', 'Hiragino Kaku Gothic ProN', 'Meiryo', sans-serif",
-                "background_color": "#fafafa",
-            },
-            "uncover": {
-                "font_family": "'Liberation Sans', 'Hiragino Sans', sans-serif",
-                "background_color": "#ffffff",
-            },
-            "default": {"font_family": "'Helvetica Neue', Arial, sans-serif"},
-        }
+        defaults = _THEME_DEFAULTS.get(theme_name)
+        if defaults is None:
+            return
 
-        if theme_name in theme_defaults:
-            defaults = theme_defaults[theme_name]
-            if not self.font_family and "font_family" in defaults:
-                self.font_family = defaults["font_family"]
-            if not self.background_color and "background_color" in defaults:
-                self.background_color = defaults["background_color"]
+        for attr in ("font_family", "background_color"):
+            if not getattr(self, attr):
+                value = defaults.get(attr)
+                if value:
+                    setattr(self, attr, value)
 
     def get_slide_break_syntax(self) -> str:
         """Get the syntax for slide breaks."""
@@ -255,11 +286,31 @@ class MarpConfig(T2DBaseModel):
         return f"\n<!-- _footer: '' -->\n<!-- _paginate: false -->\n\n{notes}\n\n---\n"
 
 
+# (attribute, directive template) pairs emitted by SlideDirective.to_markdown_comment,
+# in output order. Flags are emitted when truthy, texts whenever set (even empty).
+_SLIDE_FLAGS = (
+    ("class_", "_class: {}"),
+    ("bg", "bg: {}"),
+    ("bg_color", "backgroundColor: {}"),
+    ("bg_image", "backgroundImage: url('{}')"),
+    ("bg_size", "backgroundSize: {}"),
+    ("paginate_skip", "_paginate: false"),
+)
+_SLIDE_TEXTS = (
+    ("header", "_header: '{}'"),
+    ("footer", "_footer: '{}'"),
+)
+
+
 class SlideDirective(T2DBaseModel):
     """Individual slide directives for fine control."""
 
+    model_config = ConfigDict(validate_assignment=False)
+
     # Layout directives
-    class_: Literal["lead", "invert", "fit", "centered"] | None = Field(default=None, alias="class")
+    class_: Annotated[Literal["lead", "invert", "fit", "centered"] | None, CaseInsensitive] = Field(
+        default=None, alias="class"
+    )
 
     # Background directives (per slide)
     bg: str | None = Field(default=None, description="Background color or image URL")
@@ -279,24 +330,14 @@ class SlideDirective(T2DBaseModel):
 
     def to_markdown_comment(self) -> str:
         """Convert to HTML comment for slide."""
-        directives = []
-
-        if self.class_:
-            directives.append(f"_class: {self.class_}")
-        if self.bg:
-            directives.append(f"bg: {self.bg}")
-        if self.bg_color:
-            directives.append(f"backgroundColor: {self.bg_color}")
-        if self.bg_image:
-            directives.append(f"backgroundImage: url('{self.bg_image}')")
-        if self.bg_size:
-            directives.append(f"backgroundSize: {self.bg_size}")
-        if self.paginate_skip:
-            directives.append("_paginate: false")
-        if self.header is not None:
-            directives.append(f"_header: '{self.header}'")
-        if self.footer is not None:
-            directives.append(f"_footer: '{self.footer}'")
+        directives = [
+            fmt.format(value) for attr, fmt in _SLIDE_FLAGS if (value := getattr(self, attr))
+        ]
+        directives.extend(
+            fmt.format(value)
+            for attr, fmt in _SLIDE_TEXTS
+            if (value := getattr(self, attr)) is not None
+        )
 
         if directives:
             return f"<!-- {' '.join(directives)} -->"
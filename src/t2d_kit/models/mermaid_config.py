@@ -1,19 +1,40 @@
 """T022: MermaidConfig model for advanced Mermaid diagram configuration."""
 
 import json
-from typing import Any, Literal
+from types import MappingProxyType
+from typing import Annotated, Any, Literal
 
-from pydantic import Field, model_validator
+from pydantic import ConfigDict, Field
 
-from .base import T2DBaseModel
+from .base import CaseInsensitive, T2DBaseModel
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+# Theme variables applied when look_and_feel is "handDrawn"; user-supplied
+# theme_variables take precedence over these.
+_HANDDRAWN_DEFAULTS = MappingProxyType(
+    {
+        "fontFamily": "Kalam, cursive",
+        "primaryBorderColor": "#666",
+        "primaryColor": "#f9f9f9",
+    }
+)
 
 
 class MermaidConfig(T2DBaseModel):
     """Advanced Mermaid diagram configuration options."""
 
+    model_config = ConfigDict(validate_assignment=False)
+
     # Theme configuration
-    theme: Literal[
-        "default", "dark", "forest", "neutral", "base", "minimal", "neo", "future", "vintage"
+    theme: Annotated[
+        Literal[
+            "default", "dark", "forest", "neutral", "base", "minimal", "neo", "future", "vintage"
+        ],
+        CaseInsensitive,
     ] = Field(default="default", description="Mermaid theme to apply")
 
     # Custom theme variables
@@ -27,7 +48,7 @@ class MermaidConfig(T2DBaseModel):
     )
 
     # Security level
-    security_level: Literal["strict", "loose", "antiscript"] = Field(
+    security_level: Annotated[Literal["strict", "loose", "antiscript"], CaseInsensitive] = Field(
         default="strict", description="Security level for rendering"
     )
 
@@ -72,22 +93,6 @@ class MermaidConfig(T2DBaseModel):
     # Accessibility
     wrap: bool = Field(default=False, description="Enable text wrapping in nodes")
 
-    @model_validator(mode="after")
-    def apply_diagram_defaults(self) -> "MermaidConfig":
-        """Apply sensible defaults based on look_and_feel."""
-        if self.look_and_feel == "handDrawn":
-            if not self.theme_variables:
-                self.theme_variables = {}
-            # Apply hand-drawn style variables
-            self.theme_variables.update(
-                {
-                    "fontFamily": "Kalam, cursive",
-                    "primaryBorderColor": "#666",
-                    "primaryColor": "#f9f9f9",
-                }
-            )
-        return self
-
     def to_config_json(self) -> str:
         """Generate mermaid configuration JSON."""
         config: dict[str, Any] = {
@@ -96,9 +101,12 @@ class MermaidConfig(T2DBaseModel):
             "look": self.look_and_feel,
         }
 
-        # Add theme variables
-        if self.theme_variables:
-            config["themeVariables"] = self.theme_variables
+        # Add theme variables (hand-drawn defaults are merged in lazily here)
+        theme_vars = self.theme_variables
+        if self.look_and_feel == "handDrawn":
+            theme_vars = {**_HANDDRAWN_DEFAULTS, **(theme_vars or {})}
+        if theme_vars:
+            config["themeVariables"] = theme_vars
 
         # Add diagram-specific configs
         if self.flowchart_config:
@@ -121,6 +129,8 @@ class MermaidConfig(T2DBaseModel):
         # Add wrap
         config["wrap"] = self.wrap
 
+        if orjson is not None:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(config, indent=2)
 
     def to_cli_args(self) -> list[str]:
@@ -268,18 +278,36 @@ class MermaidConfig(T2DBaseModel):
 
     def optimize_for_output_format(self, output_format: str) -> None:
         """Optimize configuration for specific output format."""
-        if output_format.lower() == "png":
-            # Optimize for PNG output
-            if not self.width:
-                self.width = 1920
-            if not self.height:
-                self.height = 1080
-            self.background_color = "white"
-        elif output_format.lower() == "svg":
-            # Optimize for SVG output
-            self.background_color = "transparent"
-        elif output_format.lower() == "pdf":
-            # Optimize for PDF output
-            self.background_color = "white"
-            if not self.width:
-                self.width = 1920
+        _OUTPUT_OPTIMIZERS.get(output_format.lower(), _optimize_noop)(self)
+
+
+def _optimize_png(config: MermaidConfig) -> None:
+    if not config.width:
+        config.width = 1920
+    if not config.height:
+        config.height = 1080
+    config.background_color = "white"
+
+
+def _optimize_svg(config: MermaidConfig) -> None:
+    config.background_color = "transparent"
+
+
+def _optimize_pdf(config: MermaidConfig) -> None:
+    config.background_color = "white"
+    if not config.width:
+        config.width = 1920
+
+
+def _optimize_noop(config: MermaidConfig) -> None:
+    pass
+
+
+# Per-format tweaks applied by MermaidConfig.optimize_for_output_format
+_OUTPUT_OPTIMIZERS = MappingProxyType(
+    {
+        "png": _optimize_png,
+        "svg": _optimize_svg,
+        "pdf": _optimize_pdf,
+    }
+)
@@ -1,17 +1,52 @@
 """T023: MkDocsPageConfig model for generating MkDocs-compatible pages."""
 
-from datetime import datetime
+import io
+from datetime import UTC, datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import Field
+import yaml
+from pydantic import ConfigDict, Field
 
 from .base import T2DBaseModel
 
 
+class _NavDumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    """Safe dumper (C-backed when available) that never emits anchors/aliases."""
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def dump_nav(entry: dict[str, Any]) -> str:
+    """Serialize a nav entry from MkDocsPageConfig.create_nav_entry to YAML.
+
+    Keeps the page order as built, never folds long lines and skips alias
+    detection, since nav entries have no shared references.
+    """
+    return yaml.dump(
+        entry,
+        Dumper=_NavDumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+        width=2**31 - 1,  # effectively no folding; the C emitter needs an int
+    )
+
+
+@lru_cache(maxsize=4096)
+def _page_title(page: str) -> str:
+    """Derive a display title from a page filename, e.g. ``api-guide.md`` -> ``Api Guide``."""
+    return page.replace(".md", "").replace("-", " ").title()
+
+
 class MkDocsPageConfig(T2DBaseModel):
     """Configuration for generating MkDocs-compatible pages to integrate into existing sites."""
 
+    # Read-only once built, which keeps the cached renderings below valid
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     # Output configuration
     output_dir: Path = Field(
         default=Path("docs"), description="Directory where markdown pages will be generated"
@@ -137,6 +172,22 @@ class MkDocsPageConfig(T2DBaseModel):
         default=None, description="Custom CSS classes to apply to elements"
     )
 
+    @cached_property
+    def _static_frontmatter(self) -> str:
+        """Frontmatter lines that don't depend on the page, each prefixed by a newline."""
+        lines = ""
+        if self.page_template:
+            lines += f"\ntemplate: {self.page_template}"
+        if self.page_category:
+            lines += f"\ncategory: {self.page_category}"
+        if self.page_tags:
+            lines += f"\ntags: {', '.join(self.page_tags)}"
+        if self.page_authors:
+            lines += f"\nauthors: {', '.join(self.page_authors)}"
+        if self.nav_position is not None:
+            lines += f"\nnav_order: {self.nav_position}"
+        return lines
+
     def generate_frontmatter(
         self,
         title: str,
@@ -144,45 +195,31 @@ class MkDocsPageConfig(T2DBaseModel):
         extra_metadata: dict[str, Any] | None = None,
     ) -> str:
         """Generate frontmatter for a page."""
-        fm = ["---"]
-        fm.append(f"title: {title}")
-
-        if description:
-            fm.append(f"description: {description}")
-
-        if self.page_template:
-            fm.append(f"template: {self.page_template}")
-
-        if self.page_category:
-            fm.append(f"category: {self.page_category}")
-
-        if self.page_tags:
-            fm.append(f"tags: {', '.join(self.page_tags)}")
-
-        if self.page_authors:
-            fm.append(f"authors: {', '.join(self.page_authors)}")
-
-        if self.nav_position is not None:
-            fm.append(f"nav_order: {self.nav_position}")
-
-        if self.include_created_date:
-            fm.append(f"created: {datetime.utcnow().isoformat()}")
-
-        if self.include_updated_date:
-            fm.append(f"updated: {datetime.utcnow().isoformat()}")
-
-        # Add any extra metadata
+        description_line = f"\ndescription: {description}" if description else ""
+
+        # One timestamp per page so created/updated agree
+        created_line = updated_line = ""
+        if self.include_created_date or self.include_updated_date:
+            now = datetime.now(UTC).isoformat()
+            if self.include_created_date:
+                created_line = f"\ncreated: {now}"
+            if self.include_updated_date:
+                updated_line = f"\nupdated: {now}"
+
+        # Extra metadata is unbounded, so it is the only part built with a join
+        extra_lines = ""
         if extra_metadata:
-            for key, value in extra_metadata.items():
-                if isinstance(value, list):
-                    fm.append(f"{key}: {', '.join(str(v) for v in value)}")
-                else:
-                    fm.append(f"{key}: {value}")
-
-        fm.append("---")
-        fm.append("")
-
-        return "\n".join(fm)
+            extra_lines = "".join(
+                f"\n{key}: {', '.join(str(v) for v in value)}"
+                if isinstance(value, list)
+                else f"\n{key}: {value}"
+                for key, value in extra_metadata.items()
+            )
+
+        return (
+            f"---\ntitle: {title}{description_line}{self._static_frontmatter}"
+            f"{created_line}{updated_line}{extra_lines}\n---\n"
+        )
 
     def get_diagram_reference(self, diagram_path: Path, alt_text: str) -> str:
         """Generate markdown for embedding a diagram."""
@@ -212,52 +249,44 @@ class MkDocsPageConfig(T2DBaseModel):
         """Generate Material content tabs syntax."""
         if not self.use_content_tabs:
             # Fallback to sections
-            sections = []
-            for tab_name, tab_content in tabs.items():
-                sections.append(f"### {tab_name}\n\n{tab_content}")
-            return "\n\n".join(sections)
+            return "\n\n".join(
+                f"### {tab_name}\n\n{tab_content}" for tab_name, tab_content in tabs.items()
+            )
 
-        tab_blocks = []
-        for tab_name, tab_content in tabs.items():
-            tab_blocks.append(f'=== "{tab_name}"\n\n    {tab_content}')
+        return "\n\n".join(
+            f'=== "{tab_name}"\n\n    {tab_content}' for tab_name, tab_content in tabs.items()
+        )
+
+    @cached_property
+    def _output_prefix(self) -> Path:
+        """Directory generated pages are written to."""
+        if self.pages_subdir:
+            return self.output_dir / self.pages_subdir
+        return self.output_dir
 
-        return "\n\n".join(tab_blocks)
+    @cached_property
+    def _link_prefix(self) -> str:
+        """Prefix for page links relative to the docs root, e.g. ``api/``."""
+        return f"{self.pages_subdir}/" if self.pages_subdir else ""
 
     def get_output_path(self, filename: str) -> Path:
         """Get the full output path for a file."""
-        if self.pages_subdir:
-            return self.output_dir / self.pages_subdir / filename
-        return self.output_dir / filename
+        return self._output_prefix / filename
 
     def create_nav_entry(self, pages: list[str]) -> dict[str, Any]:
-        """Create navigation entry for mkdocs.yml."""
-        nav_entry: dict[str, Any] = {}
+        """Create navigation entry for mkdocs.yml.
+
+        Serialize the result with dump_nav() rather than yaml.dump defaults.
+        """
+        title_prefix = f"{self.nav_title_prefix} " if self.nav_title_prefix else ""
+        link_prefix = self._link_prefix
+        entries = [(f"{title_prefix}{_page_title(page)}", f"{link_prefix}{page}") for page in pages]
 
         if self.nav_parent:
             # Nested under parent
-            nav_entry[self.nav_parent] = []
-            for page in pages:
-                page_title = page.replace(".md", "").replace("-", " ").title()
-                if self.nav_title_prefix:
-                    page_title = f"{self.nav_title_prefix} {page_title}"
-
-                if self.pages_subdir:
-                    nav_entry[self.nav_parent].append({page_title: f"{self.pages_subdir}/{page}"})
-                else:
-                    nav_entry[self.nav_parent].append({page_title: page})
-        else:
-            # Top level
-            for page in pages:
-                page_title = page.replace(".md", "").replace("-", " ").title()
-                if self.nav_title_prefix:
-                    page_title = f"{self.nav_title_prefix} {page_title}"
-
-                if self.pages_subdir:
-                    nav_entry[page_title] = f"{self.pages_subdir}/{page}"
-                else:
-                    nav_entry[page_title] = page
-
-        return nav_entry
+            return {self.nav_parent: [{title: link} for title, link in entries]}
+        # Top level
+        return dict(entries)
 
     def get_code_block_syntax(
         self,
@@ -287,44 +316,46 @@ class MkDocsPageConfig(T2DBaseModel):
         """Generate Material grid layout."""
         if not self.use_grids:
             # Fallback to simple layout
-            sections = []
-            for item in items:
-                sections.append(f"## {item.get('title', 'Section')}\n\n{item.get('content', '')}")
-            return "\n\n".join(sections)
+            return "\n\n".join(
+                f"## {item.get('title', 'Section')}\n\n{item.get('content', '')}" for item in items
+            )
 
-        grid_html = '<div class="grid cards" markdown>\n\n'
+        buf = io.StringIO()
+        write = buf.write
+        write('<div class="grid cards" markdown>\n\n')
         for item in items:
-            grid_html += f"- **{item.get('title', 'Title')}**\n\n"
-            grid_html += f"    {item.get('content', 'Content')}\n\n"
-        grid_html += "</div>"
+            write(f"- **{item.get('title', 'Title')}**\n\n")
+            write(f"    {item.get('content', 'Content')}\n\n")
+        write("</div>")
 
-        return grid_html
+        return buf.getvalue()
 
     def generate_index_page(
         self, pages: list[str], descriptions: dict[str, str] | None = None
     ) -> str:
         """Generate an index page for the documentation set."""
-        content = self.generate_frontmatter(
-            title=self.index_title,
-            description=self.index_description
-            or f"Generated documentation for {self.index_title.lower()}",
-        )
-
-        content += f"# {self.index_title}\n\n"
+        parts = [
+            self.generate_frontmatter(
+                title=self.index_title,
+                description=self.index_description
+                or f"Generated documentation for {self.index_title.lower()}",
+            ),
+            f"# {self.index_title}\n\n",
+        ]
 
         if self.index_description:
-            content += f"{self.index_description}\n\n"
+            parts.append(f"{self.index_description}\n\n")
 
-        content += "## Contents\n\n"
+        parts.append("## Contents\n\n")
 
         for page in pages:
-            page_name = page.replace(".md", "").replace("-", " ").title()
-            page_link = page if not self.pages_subdir else f"{self.pages_subdir}/{page}"
+            page_name = _page_title(page)
+            page_link = f"{self._link_prefix}{page}"
 
             description = ""
             if descriptions and page in descriptions:
                 description = f" - {descriptions[page]}"
 
-            content += f"- [{page_name}]({page_link}){description}\n"
+            parts.append(f"- [{page_name}]({page_link}){description}\n")
 
-        return content
+        return "".join(parts)
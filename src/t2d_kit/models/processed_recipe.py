@@ -1,20 +1,33 @@
 """T017: ProcessedRecipe model with cross-field validation."""
 
-from datetime import UTC, datetime, timezone
+from datetime import datetime
 from typing import Any
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import AwareDatetime, ConfigDict, Field, model_validator
 
 from .base import (
     DiagramType,
+    GenerationStatus,
     NameField,
-    OutputFormat,
     PathField,
     T2DBaseModel,
     VersionField,
 )
 
 
+class ActualPaths(T2DBaseModel):
+    """Rendered file paths for a diagram, one per generated output format."""
+
+    svg: str | None = None
+    png: str | None = None
+    pdf: str | None = None
+    inline: str | None = None
+
+    def has_any(self) -> bool:
+        """Check if at least one output path is set."""
+        return any(path is not None for path in (self.svg, self.png, self.pdf, self.inline))
+
+
 class DiagramReference(T2DBaseModel):
     """Metadata about diagrams that will be available to content agents."""
 
@@ -22,18 +35,10 @@ class DiagramReference(T2DBaseModel):
     title: NameField
     type: DiagramType
     expected_path: PathField
-    actual_paths: dict[OutputFormat, str] | None = None
+    actual_paths: ActualPaths | None = None
     description: str | None = Field(None, max_length=500)
-    status: str = "pending"  # pending, generated, failed
-
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        """Validate generation status."""
-        valid_statuses = {"pending", "generated", "failed"}
-        if v not in valid_statuses:
-            raise ValueError(f"Status must be one of: {valid_statuses}")
-        return v
+    # validate_default stores the plain "pending" value, matching use_enum_values
+    status: GenerationStatus = Field(default=GenerationStatus.PENDING, validate_default=True)
 
 
 class OutputConfig(T2DBaseModel):
@@ -47,45 +52,29 @@ class OutputConfig(T2DBaseModel):
 class ProcessedRecipe(T2DBaseModel):
     """Agent-generated recipe with detailed specifications."""
 
+    # Forward refs are resolved on first use instead of at import time
+    model_config = ConfigDict(defer_build=True)
+
     name: NameField
     version: VersionField
     source_recipe: PathField
-    generated_at: datetime | str
+    generated_at: AwareDatetime
     content_files: list["ContentFile"] = Field(min_length=1)
     diagram_specs: list["DiagramSpecification"] = Field(min_length=1)
     diagram_refs: list[DiagramReference] = Field(min_length=1)
     outputs: OutputConfig
     generation_notes: list[str] | None = None
 
-    @field_validator("generated_at")
-    @classmethod
-    def validate_generation_time(cls, v: datetime | str) -> datetime:
+    @model_validator(mode="after")
+    def validate_generation_time(self) -> "ProcessedRecipe":
         """Ensure generation time is not in the future."""
-        # Convert string to datetime if needed
-        if isinstance(v, str):
-            from datetime import timezone as tz
-            try:
-                # Handle ISO format with Z suffix
-                if v.endswith("Z"):
-                    v = v[:-1] + "+00:00"
-                v = datetime.fromisoformat(v)
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Invalid datetime format: {v}") from e
-
-        # Ensure both datetimes have timezone info for comparison
-        if v.tzinfo is None:
-            # If input is naive, assume UTC
-            v = v.replace(tzinfo=UTC)
-
-        # Compare with current time in the same timezone
-        now = datetime.now(v.tzinfo)
-        if v > now:
+        if self.generated_at > datetime.now(self.generated_at.tzinfo):
             raise ValueError("Generation time cannot be in the future")
-        return v
+        return self
 
     @model_validator(mode="after")
     def validate_diagram_consistency(self) -> "ProcessedRecipe":
-        """Ensure diagram specs and refs are consistent."""
+        """Ensure diagram specs, refs, and content file references are consistent."""
         spec_ids = {spec.id for spec in self.diagram_specs}
         ref_ids = {ref.id for ref in self.diagram_refs}
 
@@ -99,27 +88,24 @@ class ProcessedRecipe(T2DBaseModel):
                 errors.append(f"Extra diagram references: {extra_refs}")
             raise ValueError("; ".join(errors))
 
-        return self
-
-    @model_validator(mode="after")
-    def validate_content_diagram_refs(self) -> "ProcessedRecipe":
-        """Ensure content files reference valid diagrams."""
-        valid_diagram_ids = {spec.id for spec in self.diagram_specs}
-
+        # Content files may only reference known diagrams
         for content_file in self.content_files:
-            invalid_refs = set(content_file.diagram_refs) - valid_diagram_ids
+            invalid_refs = [ref for ref in content_file.diagram_refs if ref not in spec_ids]
             if invalid_refs:
                 raise ValueError(
-                    f"Content file '{content_file.path}' references invalid diagrams: {invalid_refs}"
+                    f"Content file '{content_file.path}' references invalid diagrams: "
+                    f"{set(invalid_refs)}"
                 )
 
         return self
 
+    @property
+    def diagram_count(self) -> int:
+        """Number of diagrams specified in this recipe."""
+        return len(self.diagram_specs)
+
 
 # Import here to avoid circular imports
 from .content import ContentFile
 from .diagram import DiagramSpecification
 
-# Update forward references
-ProcessedRecipe.model_rebuild()
-
@@ -1,11 +1,17 @@
 """T020: StateManager for file-based coordination between agents."""
 
-import json
-from datetime import datetime
+import contextlib
+import copy
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
+
+from t2d_kit.utils.json_io import atomic_write_bytes, dumps, loads, write_temp_file
 
 from .base import T2DBaseModel
 
@@ -15,6 +21,9 @@ class StateManager(T2DBaseModel):
 
     state_dir: Path = Field(default=Path(".t2d-state"), description="Directory for state files")
 
+    # key -> ((inode, mtime_ns, size) of the file when parsed, parsed state)
+    _read_cache: dict[str, tuple[tuple[int, int, int], dict]] = PrivateAttr(default_factory=dict)
+
     @field_validator("state_dir")
     @classmethod
     def ensure_state_dir(cls, v: Path) -> Path:
@@ -25,22 +34,64 @@ class StateManager(T2DBaseModel):
     def write_state(self, key: str, data: dict) -> None:
         """Write state data to file."""
         state_file = self.state_dir / f"{key}.json"
-        state_file.write_text(json.dumps(data, indent=2, default=str))
+        atomic_write_bytes(state_file, dumps(data, indent=True))
+
+    def write_states_batch(self, items: dict[str, dict]) -> None:
+        """Write several state files together.
+
+        Everything is serialized before the first file is touched, so a value
+        that can't be encoded leaves all of the existing states untouched.
+        """
+        payloads = {key: dumps(data, indent=True) for key, data in items.items()}
+        for key, payload in payloads.items():
+            atomic_write_bytes(self.state_dir / f"{key}.json", payload)
 
     def read_state(self, key: str) -> dict | None:
-        """Read state data from file."""
+        """Read state data from file.
+
+        A file whose inode, mtime and size are unchanged since the last read
+        isn't read or parsed again. Callers get their own copy of the state.
+        """
         state_file = self.state_dir / f"{key}.json"
-        if state_file.exists():
-            return json.loads(state_file.read_text())
-        return None
+        try:
+            st = state_file.stat()
+        except FileNotFoundError:
+            self._read_cache.pop(key, None)
+            return None
+
+        # Writes replace the file (and so its inode), which also catches a
+        # same-size rewrite within the mtime granularity. Single dict get/set
+        # calls are atomic, so read_states' worker threads need no lock.
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._read_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, loads(state_file.read_bytes()))
+            self._read_cache[key] = cached
+        return copy.deepcopy(cached[1])
+
+    def read_states(self, keys: list[str]) -> dict[str, dict | None]:
+        """Read several state files concurrently.
+
+        Missing keys map to None, as with read_state.
+        """
+        if len(keys) < 2:
+            return {key: self.read_state(key) for key in keys}
+        with ThreadPoolExecutor(max_workers=min(8, len(keys))) as pool:
+            return dict(zip(keys, pool.map(self.read_state, keys)))
 
     def list_states(self) -> list[str]:
         """List all available state keys."""
-        return [f.stem for f in self.state_dir.glob("*.json")]
+        with os.scandir(self.state_dir) as entries:
+            return [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
 
     def delete_state(self, key: str) -> bool:
         """Delete a state file."""
         state_file = self.state_dir / f"{key}.json"
+        self._read_cache.pop(key, None)
         if state_file.exists():
             state_file.unlink()
             return True
@@ -53,30 +104,30 @@ class StateManager(T2DBaseModel):
         if not state_file.exists():
             return None
 
+        # Read once; every recovery attempt below works on this buffer
+        raw = state_file.read_bytes()
         try:
-            # Try normal read first
-            return json.loads(state_file.read_text())
-        except json.JSONDecodeError:
-            # Try to read backup if exists
-            backup_file = self.state_dir / f"{key}.json.backup"
-            if backup_file.exists():
-                try:
-                    return json.loads(backup_file.read_text())
-                except json.JSONDecodeError:
-                    pass
-
-            # Try partial recovery - read line by line
+            return loads(raw)
+        except ValueError:
+            pass
+
+        # Try to read backup if exists
+        backup_file = self.state_dir / f"{key}.json.backup"
+        if backup_file.exists():
             try:
-                lines = state_file.read_text().splitlines()
-                for i in range(len(lines), 0, -1):
-                    try:
-                        partial = "\n".join(lines[:i])
-                        return json.loads(partial)
-                    except json.JSONDecodeError:
-                        continue
-            except Exception:
+                return loads(backup_file.read_bytes())
+            except ValueError:
                 pass
 
+        # Try partial recovery - longest prefix ending in a closing brace that parses
+        text = raw.decode("utf-8", "replace")
+        end = text.rfind("}")
+        while end != -1:
+            try:
+                return loads(text[: end + 1])
+            except ValueError:
+                end = text.rfind("}", 0, end)
+
         return None
 
     def write_state_with_backup(self, key: str, data: dict) -> None:
@@ -84,22 +135,32 @@ class StateManager(T2DBaseModel):
         state_file = self.state_dir / f"{key}.json"
         backup_file = self.state_dir / f"{key}.json.backup"
 
-        # Create backup of existing file if it exists
-        if state_file.exists():
-            backup_file.write_text(state_file.read_text())
+        # Stage the new state first so the main file is only briefly absent
+        tmp_file = write_temp_file(state_file, dumps(data, indent=True))
 
-        # Write new state
-        self.write_state(key, data)
+        # The previous version becomes the backup by rename instead of a copy
+        try:
+            with contextlib.suppress(FileNotFoundError):  # no previous version
+                os.replace(state_file, backup_file)
+            os.replace(tmp_file, state_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
     def cleanup_old_states(self, max_age_days: int = 7) -> int:
         """Clean up state files older than specified days."""
-        cutoff = datetime.now().timestamp() - (max_age_days * 24 * 60 * 60)
+        cutoff_ns = time.time_ns() - max_age_days * 24 * 60 * 60 * 1_000_000_000
         cleaned = 0
 
-        for state_file in self.state_dir.glob("*.json"):
-            if state_file.stat().st_mtime < cutoff:
-                state_file.unlink()
-                cleaned += 1
+        # DirEntry.stat() reuses metadata from the directory scan where possible
+        with os.scandir(self.state_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                if entry.stat().st_mtime_ns < cutoff_ns:
+                    os.unlink(entry.path)
+                    self._read_cache.pop(entry.name[:-5], None)
+                    cleaned += 1
 
         return cleaned
 
@@ -138,7 +199,7 @@ class ProcessingState(T2DBaseModel):
 
     def complete(self) -> None:
         """Mark processing as complete."""
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
         self.phase = "complete"
 
     def is_complete(self) -> bool:
@@ -177,19 +238,19 @@ class DiagramGenerationState(T2DBaseModel):
     def mark_started(self) -> None:
         """Mark generation as started."""
         self.status = "generating"
-        self.started_at = datetime.utcnow()
+        self.started_at = datetime.now(UTC)
 
     def mark_complete(self, files: list[Path]) -> None:
         """Mark generation as complete with output files."""
         self.status = "complete"
         self.output_files = files
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
 
     def mark_failed(self, error: str) -> None:
         """Mark generation as failed."""
         self.status = "failed"
         self.error_message = error
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
 
 
 class ContentGenerationState(T2DBaseModel):
@@ -206,7 +267,7 @@ class ContentGenerationState(T2DBaseModel):
     def mark_started(self) -> None:
         """Mark content generation as started."""
         self.status = "generating"
-        self.started_at = datetime.utcnow()
+        self.started_at = datetime.now(UTC)
 
     def add_diagram(self, path: Path) -> None:
         """Add a discovered diagram."""
@@ -217,13 +278,13 @@ class ContentGenerationState(T2DBaseModel):
         """Mark content generation as complete."""
         self.status = "complete"
         self.output_path = output_path
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
 
     def mark_failed(self, error: str) -> None:
         """Mark content generation as failed."""
         self.status = "failed"
         self.error_message = error
-        self.completed_at = datetime.utcnow()
+        self.completed_at = datetime.now(UTC)
 
 
 class AgentCoordinationState(T2DBaseModel):
@@ -251,23 +312,18 @@ class AgentCoordinationState(T2DBaseModel):
 
     def can_agent_start(self, agent_id: str) -> bool:
         """Check if an agent can start based on dependencies."""
-        if agent_id not in self.dependencies:
-            return True
-
-        deps = self.dependencies[agent_id]
-        for dep in deps:
-            if dep not in self.agents_working or self.agents_working[dep] != "complete":
-                return False
-
-        return True
+        agents_working = self.agents_working
+        return all(
+            agents_working.get(dep) == "complete" for dep in self.dependencies.get(agent_id, ())
+        )
 
     def get_ready_agents(self) -> list[str]:
         """Get list of agents that can start working."""
-        ready = []
-        for agent_id, status in self.agents_working.items():
-            if status == "pending" and self.can_agent_start(agent_id):
-                ready.append(agent_id)
-        return ready
+        return [
+            agent_id
+            for agent_id, status in self.agents_working.items()
+            if status == "pending" and self.can_agent_start(agent_id)
+        ]
 
     def is_all_complete(self) -> bool:
         """Check if all agents have completed their work."""
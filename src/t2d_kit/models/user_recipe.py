@@ -20,6 +20,13 @@ from .base import (
     VersionField,
 )
 
+_RECIPE_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_-]*$")
+
+_LAYOUT_ENGINES = frozenset({"dagre", "elk", "tala"})
+
+# Valid D2 theme IDs based on the catalog
+_D2_THEME_IDS = frozenset({0, 1, 3, 4, 5, 6, 7, 8, 100, 101, 102, 103, 104, 105, 200, 300, 301})
+
 
 class DiagramRequest(T2DBaseModel):
     """User's high-level diagram request.
@@ -31,6 +38,7 @@ class DiagramRequest(T2DBaseModel):
     type: str = Field(
         min_length=1,
         max_length=100,
+        pattern=r"^[a-z][a-z0-9_]*$",
         description="Diagram type (e.g., architecture, sequence, erd, flowchart, c4_container, sql_schema, class_diagram)",
         examples=["architecture", "sequence", "erd", "c4_container", "flowchart"]
     )
@@ -63,6 +71,7 @@ class DiagramRequest(T2DBaseModel):
     )
 
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             'examples': [
                 {
@@ -85,14 +94,13 @@ class DiagramRequest(T2DBaseModel):
         }
     )
 
-    @field_validator("type")
+    @field_validator("type", mode="before")
     @classmethod
-    def validate_type_format(cls, v: str) -> str:
-        """Normalize diagram type format."""
-        normalized = v.lower().replace(" ", "_")
-        if not re.match(r"^[a-z][a-z0-9_]*$", normalized):
-            raise ValueError("Diagram type must be alphanumeric with underscores")
-        return normalized
+    def normalize_type_format(cls, v: Any) -> Any:
+        """Normalize diagram type format; the field pattern then checks it."""
+        if isinstance(v, str):
+            return v.strip().lower().replace(" ", "_")
+        return v
 
     @field_validator("layout_engine")
     @classmethod
@@ -100,9 +108,8 @@ class DiagramRequest(T2DBaseModel):
         """Validate layout engine for D2 diagrams."""
         if v is None:
             return v
-        valid_engines = {"dagre", "elk", "tala"}
-        if v.lower() not in valid_engines:
-            raise ValueError(f"Layout engine must be one of: {valid_engines}")
+        if v.lower() not in _LAYOUT_ENGINES:
+            raise ValueError(f"Layout engine must be one of: {sorted(_LAYOUT_ENGINES)}")
         return v.lower()
 
     @field_validator("theme", "dark_theme")
@@ -111,10 +118,8 @@ class DiagramRequest(T2DBaseModel):
         """Validate D2 theme ID."""
         if v is None:
             return v
-        # Valid D2 theme IDs based on the catalog
-        valid_themes = {0, 1, 3, 4, 5, 6, 7, 8, 100, 101, 102, 103, 104, 105, 200, 300, 301}
-        if v not in valid_themes:
-            raise ValueError(f"Theme ID must be one of: {sorted(valid_themes)}")
+        if v not in _D2_THEME_IDS:
+            raise ValueError(f"Theme ID must be one of: {sorted(_D2_THEME_IDS)}")
         return v
 
 
@@ -168,7 +173,7 @@ class UserInstructions(T2DBaseModel):
         """Ensure diagram types are not duplicated."""
         seen_types = set()
         for diagram in v:
-            key = f"{diagram.type}_{diagram.description or ''}"
+            key = (diagram.type, diagram.description or "")
             if key in seen_types:
                 raise ValueError(f"Duplicate diagram request: {diagram.type}")
             seen_types.add(key)
@@ -223,6 +228,8 @@ class PRDContent(T2DBaseModel):
 class Preferences(T2DBaseModel):
     """User preferences for generation."""
 
+    model_config = ConfigDict(frozen=True)
+
     default_framework: str | None = None
     diagram_style: str | None = None
     color_scheme: str | None = None
@@ -304,7 +311,7 @@ class UserRecipe(T2DBaseModel):
     @classmethod
     def validate_name_format(cls, v: str) -> str:
         """Ensure name follows project naming conventions."""
-        if not re.match(r"^[a-zA-Z][a-zA-Z0-9_-]*$", v):
+        if not _RECIPE_NAME_RE.match(v):
             raise ValueError(
                 "Name must start with letter and contain only alphanumeric, hyphens, underscores"
             )
@@ -317,3 +324,8 @@ class UserRecipe(T2DBaseModel):
             raise ValueError("Recipe must specify at least one diagram type")
         return self
 
+    @property
+    def diagram_count(self) -> int:
+        """Number of diagrams requested by this recipe."""
+        return len(self.instructions.diagrams)
+
@@ -1,16 +1,39 @@
 """Utilities for D2 diagram generation."""
 
+import os
 import subprocess
+import time
 from functools import lru_cache
+from pathlib import Path
 
+from .json_io import atomic_write_bytes, dumps, loads
 
-@lru_cache(maxsize=1)
-def is_tala_installed() -> bool:
-    """Check if Tala layout engine is installed for D2.
+# How long a persisted Tala probe result is trusted across processes
+_TALA_CACHE_TTL = 24 * 60 * 60
 
-    Returns:
-        bool: True if Tala is available, False otherwise
-    """
+# Diagram types that get Tala (or ELK) instead of dagre
+_ARCHITECTURAL_TYPES = frozenset(
+    {
+        "c4_context",
+        "c4_container",
+        "c4_component",
+        "c4_deployment",
+        "c4_landscape",
+        "architecture",
+        "system_architecture",
+        "deployment",
+    }
+)
+
+
+def _tala_cache_file() -> Path:
+    """Location of the persisted Tala probe result."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "t2d-kit" / "tala.json"
+
+
+def _probe_tala() -> bool:
+    """Ask the d2 binary which layout engines it has (may take seconds)."""
     try:
         result = subprocess.run(
             ["d2", "layout"],
@@ -23,6 +46,48 @@ def is_tala_installed() -> bool:
         return False
 
 
+def _probe_and_persist_tala() -> bool:
+    """Probe for Tala and persist the result for other processes."""
+    installed = _probe_tala()
+    cache_file = _tala_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(cache_file, dumps({"installed": installed, "checked_at": time.time()}))
+    except OSError:
+        pass  # caching is best-effort
+    return installed
+
+
+@lru_cache(maxsize=1)
+def _cached_tala_status() -> bool:
+    cache_file = _tala_cache_file()
+    try:
+        if time.time() - cache_file.stat().st_mtime < _TALA_CACHE_TTL:
+            return bool(loads(cache_file.read_bytes())["installed"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing, stale, or unreadable cache: probe again
+    return _probe_and_persist_tala()
+
+
+def is_tala_installed(refresh: bool = False) -> bool:
+    """Check if Tala layout engine is installed for D2.
+
+    The result of probing ``d2 layout`` is memoized in-process and persisted
+    under ``$XDG_CACHE_HOME/t2d-kit`` for 24 hours, so repeated CLI runs skip
+    the subprocess.
+
+    Args:
+        refresh: Ignore cached results and probe d2 again
+
+    Returns:
+        bool: True if Tala is available, False otherwise
+    """
+    if refresh:
+        _cached_tala_status.cache_clear()
+        return _probe_and_persist_tala()
+    return _cached_tala_status()
+
+
 def get_default_layout_for_diagram(diagram_type: str) -> str:
     """Get the default layout engine for a diagram type.
 
@@ -34,19 +99,8 @@ def get_default_layout_for_diagram(diagram_type: str) -> str:
     Returns:
         str: The layout engine to use ("tala", "elk", or "dagre")
     """
-    architectural_types = {
-        "c4_context",
-        "c4_container",
-        "c4_component",
-        "c4_deployment",
-        "c4_landscape",
-        "architecture",
-        "system_architecture",
-        "deployment",
-    }
-
     # Check if this is an architectural diagram
-    if diagram_type.lower() in architectural_types:
+    if diagram_type.lower() in _ARCHITECTURAL_TYPES:
         # Prefer Tala for architectural diagrams if available
         if is_tala_installed():
             return "tala"
@@ -54,4 +108,24 @@ def get_default_layout_for_diagram(diagram_type: str) -> str:
         return "elk"
 
     # Use default dagre for other diagram types
-    return "dagre"
\ No newline at end of file
+    return "dagre"
+
+
+def resolve_layouts(diagram_types: list[str]) -> list[str]:
+    """Get the default layout engine for each of several diagram types.
+
+    Tala availability is probed at most once for the whole batch, and not at
+    all if none of the types is architectural.
+
+    Args:
+        diagram_types: Diagram types, e.g. from a recipe's diagram requests
+
+    Returns:
+        list[str]: Layout engine per diagram type, in the same order
+    """
+    architectural = [diagram_type.lower() in _ARCHITECTURAL_TYPES for diagram_type in diagram_types]
+    if not any(architectural):
+        return ["dagre"] * len(diagram_types)
+
+    architectural_layout = "tala" if is_tala_installed() else "elk"
+    return [architectural_layout if is_arch else "dagre" for is_arch in architectural]
@@ -0,0 +1,100 @@
+"""JSON encoding helpers with an optional orjson backend."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Values that aren't natively JSON serializable (paths, etc.) are converted
+    with ``str``. Datetimes are written in ISO 8601 form.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or text.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's
+            decode error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_temp_file(path: Path, data: bytes) -> Path:
+    """Write bytes to a new, uniquely named temporary file next to ``path``.
+
+    The name is unique per call, so concurrent writers (threads or
+    processes) never share a temporary file. The caller is responsible for
+    renaming or removing it.
+
+    Args:
+        path: File the temporary file will eventually replace
+        data: Bytes to write
+
+    Returns:
+        Path of the temporary file
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace a file's contents atomically.
+
+    The data is written to a temporary file next to ``path`` and renamed over
+    it, so readers never observe a partially written file.
+
+    Args:
+        path: Destination file
+        data: Bytes to write
+    """
+    tmp_path = write_temp_file(path, data)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _default(obj: Any) -> Any:
+    # Match orjson's native datetime/date/time output in the stdlib fallback
+    isoformat = getattr(obj, "isoformat", None)
+    if isoformat is not None:
+        return isoformat()
+    return str(obj)
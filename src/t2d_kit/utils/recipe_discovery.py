@@ -1,17 +1,25 @@
 """Utility functions for recipe discovery and management."""
 
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
+from .yaml_io import load_yaml
 
+# recipe dir -> (directory mtime_ns when scanned, lowercase stem -> recipe file)
+_stem_index_cache: dict[str, tuple[int, dict[str, Path]]] = {}
 
-def discover_user_recipes(recipe_dir: Path = Path("./recipes")) -> list[dict[str, Any]]:
+
+def discover_user_recipes(
+    recipe_dir: Path = Path("./recipes"), validate: bool = True
+) -> list[dict[str, Any]]:
     """Discover all user recipes in a directory.
 
     Args:
         recipe_dir: Directory to search for recipes
+        validate: Parse each recipe to fill in ``valid``. When False, only
+            directory metadata is read and ``valid`` is None.
 
     Returns:
         List of recipe metadata dictionaries
@@ -21,26 +29,32 @@ def discover_user_recipes(recipe_dir: Path = Path("./recipes")) -> list[dict[str
     if not recipe_dir.exists():
         return recipes
 
-    for recipe_file in recipe_dir.glob("*.yaml"):
-        # Skip processed recipes
-        if recipe_file.name.endswith(".t2d.yaml"):
-            continue
-
-        try:
-            with open(recipe_file) as f:
-                content = yaml.safe_load(f)
-
-            stat = recipe_file.stat()
-            recipes.append({
-                "name": recipe_file.stem,
-                "path": str(recipe_file),
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "size_bytes": stat.st_size,
-                "valid": bool(content and content.get("name") and content.get("instructions"))
-            })
-        except Exception:
-            # Skip invalid files
-            pass
+    with os.scandir(recipe_dir) as entries:
+        for entry in entries:
+            # Skip processed recipes
+            if not entry.name.endswith(".yaml") or entry.name.endswith(".t2d.yaml"):
+                continue
+
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+
+                valid = None
+                if validate:
+                    content = load_yaml(Path(entry.path), stat)
+                    valid = bool(content and content.get("name") and content.get("instructions"))
+
+                recipes.append({
+                    "name": entry.name[:-5],
+                    "path": entry.path,
+                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    "size_bytes": stat.st_size,
+                    "valid": valid
+                })
+            except Exception:
+                # Skip invalid files
+                pass
 
     return sorted(recipes, key=lambda r: r["name"])
 
@@ -63,10 +77,9 @@ def discover_processed_recipes(
 
     for recipe_file in processed_dir.glob("*.t2d.yaml"):
         try:
-            with open(recipe_file) as f:
-                content = yaml.safe_load(f)
-
             stat = recipe_file.stat()
+            content = load_yaml(recipe_file, stat)
+
             recipes.append({
                 "name": recipe_file.stem.replace(".t2d", ""),
                 "path": str(recipe_file),
@@ -98,12 +111,35 @@ def find_recipe_by_name(name: str, recipe_dir: Path = Path("./recipes")) -> Path
     if recipe_path.exists():
         return recipe_path
 
-    # Try case-insensitive match
-    for recipe_file in recipe_dir.glob("*.yaml"):
-        if recipe_file.stem.lower() == name.lower():
-            return recipe_file
+    # Try case-insensitive match. A miss rescans, since a file added within
+    # the filesystem's mtime resolution doesn't change the directory mtime.
+    stem = name.lower()
+    match = _stem_index(recipe_dir).get(stem)
+    if match is None:
+        match = _stem_index(recipe_dir, refresh=True).get(stem)
+    return match
+
 
-    return None
+def _stem_index(recipe_dir: Path, refresh: bool = False) -> dict[str, Path]:
+    """Map lowercase recipe stems to files, rescanning only when the directory changes."""
+    try:
+        mtime_ns = recipe_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    key = os.path.abspath(recipe_dir)
+    cached = _stem_index_cache.get(key)
+    if not refresh and cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    index: dict[str, Path] = {}
+    with os.scandir(recipe_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".yaml"):
+                index.setdefault(entry.name[:-5].lower(), recipe_dir / entry.name)
+
+    _stem_index_cache[key] = (mtime_ns, index)
+    return index
 
 
 def get_recipe_summary(recipe_path: Path) -> dict[str, Any]:
@@ -119,10 +155,8 @@ def get_recipe_summary(recipe_path: Path) -> dict[str, Any]:
         return {"error": "File not found"}
 
     try:
-        with open(recipe_path) as f:
-            content = yaml.safe_load(f)
-
         stat = recipe_path.stat()
+        content = load_yaml(recipe_path, stat)
 
         # Determine if user or processed recipe
         is_processed = recipe_path.name.endswith(".t2d.yaml")
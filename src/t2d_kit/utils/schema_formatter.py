@@ -1,7 +1,8 @@
 """Schema formatting utilities for agent-friendly schema documentation."""
 
+import io
 import json
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 
 def format_schema_markdown(schema: Dict[str, Any], model_name: str) -> str:
@@ -14,179 +15,127 @@ def format_schema_markdown(schema: Dict[str, Any], model_name: str) -> str:
     Returns:
         Markdown formatted schema documentation
     """
-    lines = [
-        f"# {model_name} Schema",
-        "",
-        f"**Description:** {schema.get('description', 'No description available')}",
-        "",
-    ]
+    buf = io.StringIO()
+    write = buf.write
+
+    write(f"# {model_name} Schema\n\n")
+    write(f"**Description:** {schema.get('description', 'No description available')}\n\n")
 
     # Add title if present
     if 'title' in schema and schema['title'] != model_name:
-        lines.extend([
-            f"**Title:** {schema['title']}",
-            "",
-        ])
+        write(f"**Title:** {schema['title']}\n\n")
 
     # Extract properties and required fields
     properties = schema.get('properties', {})
     required_fields = set(schema.get('required', []))
 
     # Categorize fields
-    required = []
-    optional = []
-
-    for field_name, field_schema in properties.items():
-        field_info = _format_field(field_name, field_schema)
-        if field_name in required_fields:
-            required.append(field_info)
-        else:
-            optional.append(field_info)
+    required = [name for name in properties if name in required_fields]
+    optional = [name for name in properties if name not in required_fields]
 
     # Required fields section
     if required:
-        lines.extend([
-            "## Required Fields",
-            "",
-        ])
-        for field in required:
-            lines.extend(field)
-            lines.append("")
+        write("## Required Fields\n\n")
+        for field_name in required:
+            _write_field(write, field_name, properties[field_name])
+            write("\n")
 
     # Optional fields section
     if optional:
-        lines.extend([
-            "## Optional Fields",
-            "",
-        ])
-        for field in optional:
-            lines.extend(field)
-            lines.append("")
+        write("## Optional Fields\n\n")
+        for field_name in optional:
+            _write_field(write, field_name, properties[field_name])
+            write("\n")
 
     # Add definitions section if present
     definitions = schema.get('$defs', {})
     if definitions:
-        lines.extend([
-            "## Type Definitions",
-            "",
-        ])
+        write("## Type Definitions\n\n")
         for def_name, def_schema in definitions.items():
-            lines.extend([
-                f"### {def_name}",
-                "",
-            ])
+            write(f"### {def_name}\n\n")
             if 'description' in def_schema:
-                lines.extend([
-                    def_schema['description'],
-                    "",
-                ])
+                write(f"{def_schema['description']}\n\n")
 
             # Add enum values if present
             if def_schema.get('type') == 'string' and 'enum' in def_schema:
-                lines.extend([
-                    "**Allowed values:**",
-                ])
+                write("**Allowed values:**\n")
                 for value in def_schema['enum']:
-                    lines.append(f"  - `{value}`")
-                lines.append("")
+                    write(f"  - `{value}`\n")
+                write("\n")
 
             # Add properties for object types
             if 'properties' in def_schema:
                 def_required = set(def_schema.get('required', []))
-                lines.append("**Properties:**")
+                write("**Properties:**\n")
                 for prop_name, prop_schema in def_schema['properties'].items():
                     is_required = prop_name in def_required
                     prop_type = _get_type_description(prop_schema)
                     req_marker = "**required**" if is_required else "*optional*"
-                    lines.append(f"  - `{prop_name}` ({prop_type}) - {req_marker}")
+                    write(f"  - `{prop_name}` ({prop_type}) - {req_marker}\n")
                     if 'description' in prop_schema:
-                        lines.append(f"    {prop_schema['description']}")
-                lines.append("")
+                        write(f"    {prop_schema['description']}\n")
+                write("\n")
 
     # Add examples if present
     examples = schema.get('examples', [])
     if examples:
-        lines.extend([
-            "## Examples",
-            "",
-        ])
+        write("## Examples\n\n")
         for i, example in enumerate(examples, 1):
-            lines.extend([
-                f"### Example {i}",
-                "",
-                "```yaml",
-                json.dumps(example, indent=2),
-                "```",
-                "",
-            ])
+            write(f"### Example {i}\n\n```yaml\n{json.dumps(example, indent=2)}\n```\n\n")
 
     # Add AI guidance if present
     ai_guidance = schema.get('ai_guidance', {})
     if ai_guidance:
-        lines.extend([
-            "## AI Agent Guidance",
-            "",
-        ])
+        write("## AI Agent Guidance\n\n")
         for key, value in ai_guidance.items():
-            lines.append(f"**{key.replace('_', ' ').title()}:** {value}")
-        lines.append("")
+            write(f"**{key.replace('_', ' ').title()}:** {value}\n")
+        write("\n")
 
     # Add JSON schema at the end for reference
-    lines.extend([
-        "---",
-        "",
-        "## Full JSON Schema",
-        "",
-        "```json",
-        json.dumps(schema, indent=2),
-        "```",
-    ])
-
-    return "\n".join(lines)
+    write("---\n\n## Full JSON Schema\n\n```json\n")
+    write(json.dumps(schema, indent=2))
+    write("\n```")
 
+    return buf.getvalue()
 
-def _format_field(field_name: str, field_schema: Dict[str, Any]) -> List[str]:
-    """Format a single field as markdown lines."""
-    lines = []
 
+def _write_field(
+    write: Callable[[str], Any], field_name: str, field_schema: Dict[str, Any]
+) -> None:
+    """Write a single field as markdown lines."""
     # Field header
     field_type = _get_type_description(field_schema)
-    lines.append(f"### `{field_name}` ({field_type})")
-    lines.append("")
+    write(f"### `{field_name}` ({field_type})\n\n")
 
     # Description
     if 'description' in field_schema:
-        lines.append(field_schema['description'])
-        lines.append("")
+        write(f"{field_schema['description']}\n\n")
 
     # Constraints
     constraints = _extract_constraints(field_schema)
     if constraints:
-        lines.append("**Constraints:**")
+        write("**Constraints:**\n")
         for constraint in constraints:
-            lines.append(f"  - {constraint}")
-        lines.append("")
+            write(f"  - {constraint}\n")
+        write("\n")
 
     # Default value
     if 'default' in field_schema:
-        lines.append(f"**Default:** `{field_schema['default']}`")
-        lines.append("")
+        write(f"**Default:** `{field_schema['default']}`\n\n")
 
     # Examples
     if 'examples' in field_schema:
-        lines.append("**Examples:**")
+        write("**Examples:**\n")
         for example in field_schema['examples']:
-            lines.append(f"  - `{example}`")
-        lines.append("")
+            write(f"  - `{example}`\n")
+        write("\n")
 
     # Enum values
     if 'enum' in field_schema:
-        lines.append("**Allowed values:**")
+        write("**Allowed values:**\n")
         for value in field_schema['enum']:
-            lines.append(f"  - `{value}`")
-        lines.append("")
-
-    return lines
+            write(f"  - `{value}`\n")
+        write("\n")
 
 
 def _get_type_description(field_schema: Dict[str, Any]) -> str:
@@ -271,11 +220,9 @@ def format_schema_agent_friendly(schema: Dict[str, Any], model_name: str) -> str
     Returns:
         Concise formatted schema
     """
-    lines = [
-        f"{model_name} Schema",
-        "=" * (len(model_name) + 7),
-        "",
-    ]
+    buf = io.StringIO()
+    write = buf.write
+    write(f"{model_name} Schema\n{'=' * (len(model_name) + 7)}\n\n")
 
     properties = schema.get('properties', {})
     required_fields = set(schema.get('required', []))
@@ -283,33 +230,30 @@ def format_schema_agent_friendly(schema: Dict[str, Any], model_name: str) -> str
     # Required fields
     required = [name for name in properties.keys() if name in required_fields]
     if required:
-        lines.extend([
-            "Required Fields:",
-        ])
+        write("Required Fields:\n")
         for field_name in required:
             field_schema = properties[field_name]
             field_type = _get_type_description(field_schema)
             desc = field_schema.get('description', '')
-            lines.append(f"  • {field_name}: {field_type}")
+            write(f"  • {field_name}: {field_type}\n")
             if desc:
-                lines.append(f"    {desc}")
-        lines.append("")
+                write(f"    {desc}\n")
+        write("\n")
 
     # Optional fields
     optional = [name for name in properties.keys() if name not in required_fields]
     if optional:
-        lines.extend([
-            "Optional Fields:",
-        ])
+        write("Optional Fields:\n")
         for field_name in optional:
             field_schema = properties[field_name]
             field_type = _get_type_description(field_schema)
             desc = field_schema.get('description', '')
             default = field_schema.get('default')
             default_str = f" (default: {default})" if default is not None else ""
-            lines.append(f"  • {field_name}: {field_type}{default_str}")
+            write(f"  • {field_name}: {field_type}{default_str}\n")
             if desc:
-                lines.append(f"    {desc}")
-        lines.append("")
+                write(f"    {desc}\n")
+        write("\n")
 
-    return "\n".join(lines)
\ No newline at end of file
+    # Drop the final newline so the text ends like the other formatter's
+    return buf.getvalue()[:-1]
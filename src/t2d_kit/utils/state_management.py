@@ -1,13 +1,60 @@
 """State management utilities for t2d-kit processing."""
 
-import json
-import shutil
+import contextlib
+import os
+import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TypeVar
+
+from .json_io import atomic_write_bytes, dumps, loads, write_temp_file
 
 DEFAULT_STATE_DIR = Path("./.t2d-state")
 
+_T = TypeVar("_T")
+
+# Absolute state dirs already created by a StateManager in this process
+_verified_dirs: set[str] = set()
+
+# Per-recipe diagram status log, and the names it is renamed to while a save
+# or a compaction takes it over
+_LOG_SUFFIX = ".processing.log"
+_COMPACTING_SUFFIX = ".processing.log.compacting"
+_SUPERSEDED_SUFFIX = ".processing.log.superseded"
+
+# Logs smaller than this are never worth compacting
+_MIN_COMPACT_LOG_BYTES = 64 * 1024
+
+
+def _append_line(path: Path, line: bytes) -> int:
+    """Append one line to a file and return the file's new size."""
+    with open(path, "ab") as f:
+        f.write(line + b"\n")
+        return f.tell()
+
+
+def _replay_log(state: dict[str, Any] | None, log: bytes) -> dict[str, Any]:
+    """Apply logged diagram status records on top of a state snapshot."""
+    if state is None:
+        state = {"diagrams": {}}
+    diagrams = state.setdefault("diagrams", {})
+
+    for line in log.splitlines():
+        try:
+            record = loads(line)
+            entry = {"status": record["s"], "updated_at": record["t"]}
+            diagram_id = record["d"]
+        except (ValueError, KeyError, TypeError):
+            continue  # torn line from an interrupted append, or not a record
+
+        if "m" in record:
+            entry["message"] = record["m"]
+        diagrams[diagram_id] = entry
+        state["last_updated"] = record["t"]
+
+    return state
+
 
 class StateManager:
     """Manager for t2d-kit processing state."""
@@ -19,11 +66,43 @@ class StateManager:
             state_dir: Directory for state files (defaults to ./.t2d-state)
         """
         self.state_dir = state_dir or DEFAULT_STATE_DIR
+
+        # Managers are created per request; only the first one needs the mkdir
+        self._dir_key = os.path.abspath(self.state_dir)
+        if self._dir_key not in _verified_dirs:
+            self._ensure_state_dir()
+
+    def _ensure_state_dir(self) -> None:
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        _verified_dirs.add(self._dir_key)
+
+    def _write_in_state_dir(self, write: Callable[..., _T], *args: Any) -> _T:
+        """Run a write into the state dir, recreating the dir if it was deleted."""
+        try:
+            return write(*args)
+        except FileNotFoundError:
+            # A long-lived process can outlive the directory it verified
+            _verified_dirs.discard(self._dir_key)
+            self._ensure_state_dir()
+            return write(*args)
+
+    def _scan_state_dir(self) -> list[os.DirEntry]:
+        """List the state dir's entries; a deleted dir has none."""
+        try:
+            with os.scandir(self.state_dir) as entries:
+                return list(entries)
+        except FileNotFoundError:
+            # Let the next write recreate it
+            _verified_dirs.discard(self._dir_key)
+            return []
 
     def save_processing_state(self, recipe_name: str, state: dict[str, Any]) -> Path:
         """Save processing state for a recipe.
 
+        The saved state replaces any diagram status updates logged since the
+        last save, so pass a state obtained from load_processing_state when
+        modifying it.
+
         Args:
             recipe_name: Name of the recipe being processed
             state: State dictionary to save
@@ -31,47 +110,142 @@ class StateManager:
         Returns:
             Path to saved state file
         """
-        state_file = self.state_dir / f"{recipe_name}.processing.json"
-
         # Add timestamp
         state["last_updated"] = datetime.now().isoformat()
 
-        # Create backup if file exists
-        if state_file.exists():
-            backup_file = self.state_dir / f"{recipe_name}.processing.backup.json"
-            shutil.copy2(state_file, backup_file)
+        # Move the log aside before writing, so updates appended from here on
+        # start a new log and survive the save
+        superseded = self._log_aside(recipe_name, _SUPERSEDED_SUFFIX)
+        try:
+            state_file = self._write_snapshot(recipe_name, state)
+        except BaseException:
+            if superseded is not None:
+                self._restore_log(recipe_name, superseded)
+            raise
+        if superseded is not None:
+            superseded.unlink(missing_ok=True)
+        # A compaction interrupted earlier is superseded as well
+        (self.state_dir / f"{recipe_name}{_COMPACTING_SUFFIX}").unlink(missing_ok=True)
+        return state_file
+
+    def compact_processing_state(self, recipe_name: str) -> bool:
+        """Fold a recipe's logged status updates into its state file.
+
+        The log is renamed aside before it is read, so updates appended while
+        compacting go to a fresh log and are not lost. If compaction is
+        interrupted, the renamed log is still replayed by
+        load_processing_state.
+
+        Args:
+            recipe_name: Name of the recipe
+
+        Returns:
+            True if a log was compacted, False if there was nothing to do
+        """
+        compacting = self.state_dir / f"{recipe_name}{_COMPACTING_SUFFIX}"
+        compacted = False
+
+        # Finish an interrupted compaction before its log can be overwritten
+        if compacting.exists():
+            self._fold_log(recipe_name, compacting)
+            compacted = True
 
-        # Save state
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        if self._log_aside(recipe_name, _COMPACTING_SUFFIX) is not None:
+            self._fold_log(recipe_name, compacting)
+            compacted = True
+
+        return compacted
+
+    def _fold_log(self, recipe_name: str, log_file: Path) -> None:
+        """Replay a log that no one appends to any more into the snapshot, then drop it."""
+        try:
+            log = log_file.read_bytes()
+        except FileNotFoundError:
+            return  # another writer folded it first
+        state = self._load_snapshot(recipe_name, self._state_file(recipe_name))
+        self._write_snapshot(recipe_name, _replay_log(state, log))
+        log_file.unlink(missing_ok=True)
+
+    def _restore_log(self, recipe_name: str, aside: Path) -> None:
+        """Put a log moved aside back in place, ahead of anything logged since."""
+        log_file = self.state_dir / f"{recipe_name}{_LOG_SUFFIX}"
+        try:
+            newer = log_file.read_bytes()
+        except FileNotFoundError:
+            os.replace(aside, log_file)
+            return
+        atomic_write_bytes(log_file, aside.read_bytes() + newer)
+        aside.unlink(missing_ok=True)
+
+    def _state_file(self, recipe_name: str) -> Path:
+        return self.state_dir / f"{recipe_name}.processing.json"
+
+    def _log_aside(self, recipe_name: str, suffix: str) -> Path | None:
+        """Atomically rename a recipe's log, returning the new path if it existed."""
+        aside = self.state_dir / f"{recipe_name}{suffix}"
+        try:
+            os.replace(self.state_dir / f"{recipe_name}{_LOG_SUFFIX}", aside)
+        except FileNotFoundError:
+            return None
+        return aside
+
+    def _write_snapshot(self, recipe_name: str, state: dict[str, Any]) -> Path:
+        """Atomically replace a recipe's state file, keeping the old one as backup."""
+        state_file = self._state_file(recipe_name)
+
+        # Stage the new state first so the main file is only briefly absent
+        tmp_file = self._write_in_state_dir(write_temp_file, state_file, dumps(state, indent=True))
+
+        # The previous version becomes the backup by rename instead of a copy
+        try:
+            backup_file = self.state_dir / f"{recipe_name}.processing.backup.json"
+            with contextlib.suppress(FileNotFoundError):  # no previous version
+                os.replace(state_file, backup_file)
+            os.replace(tmp_file, state_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
         return state_file
 
     def load_processing_state(self, recipe_name: str) -> dict[str, Any] | None:
         """Load processing state for a recipe.
 
+        Diagram status updates logged since the last snapshot are applied on
+        top of it. Loading never writes; see compact_processing_state.
+
         Args:
             recipe_name: Name of the recipe
 
         Returns:
             State dictionary if found, None otherwise
         """
-        state_file = self.state_dir / f"{recipe_name}.processing.json"
+        state = self._load_snapshot(recipe_name, self._state_file(recipe_name))
+
+        # A log left aside by an interrupted compaction predates the live one
+        for suffix in (_COMPACTING_SUFFIX, _LOG_SUFFIX):
+            try:
+                log = (self.state_dir / f"{recipe_name}{suffix}").read_bytes()
+            except FileNotFoundError:
+                continue
+            state = _replay_log(state, log)
+
+        return state
 
+    def _load_snapshot(self, recipe_name: str, state_file: Path) -> dict[str, Any] | None:
+        """Read a recipe's state file, falling back to its backup."""
         if not state_file.exists():
             return None
 
         try:
-            with open(state_file) as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError):
+            return loads(state_file.read_bytes())
+        except (OSError, ValueError):
             # Try backup
             backup_file = self.state_dir / f"{recipe_name}.processing.backup.json"
             if backup_file.exists():
                 try:
-                    with open(backup_file) as f:
-                        return json.load(f)
-                except (OSError, json.JSONDecodeError):
+                    return loads(backup_file.read_bytes())
+                except (OSError, ValueError):
                     pass
             return None
 
@@ -84,6 +258,10 @@ class StateManager:
     ) -> bool:
         """Update the status of a specific diagram.
 
+        The update is appended to the recipe's log as a single JSON line
+        instead of rewriting the whole state file and its backup. Once the log
+        has grown well past the state file, it is compacted into it.
+
         Args:
             recipe_name: Name of the recipe
             diagram_id: ID of the diagram
@@ -93,22 +271,21 @@ class StateManager:
         Returns:
             True if updated successfully, False otherwise
         """
-        state = self.load_processing_state(recipe_name)
-        if not state:
-            state = {"diagrams": {}}
-
-        if "diagrams" not in state:
-            state["diagrams"] = {}
-
-        state["diagrams"][diagram_id] = {
-            "status": status,
-            "updated_at": datetime.now().isoformat()
-        }
-
+        record = {"t": datetime.now().isoformat(), "d": diagram_id, "s": status}
         if message:
-            state["diagrams"][diagram_id]["message"] = message
+            record["m"] = message
+
+        log_file = self.state_dir / f"{recipe_name}{_LOG_SUFFIX}"
+        log_size = self._write_in_state_dir(_append_line, log_file, dumps(record))
 
-        self.save_processing_state(recipe_name, state)
+        # Compact once replaying the log costs more than reading the snapshot
+        if log_size > _MIN_COMPACT_LOG_BYTES:
+            try:
+                snapshot_size = self._state_file(recipe_name).stat().st_size
+            except FileNotFoundError:
+                snapshot_size = 0
+            if log_size > 4 * snapshot_size:
+                self.compact_processing_state(recipe_name)
         return True
 
     def get_diagram_status(self, recipe_name: str, diagram_id: str) -> dict[str, Any] | None:
@@ -134,18 +311,43 @@ class StateManager:
             List of state summaries
         """
         states = []
-
-        for state_file in self.state_dir.glob("*.processing.json"):
-            recipe_name = state_file.stem.replace(".processing", "")
-
+        snapshot_suffix = ".processing.json"
+
+        # recipe name -> state file path, for recipes with a state file or a log
+        recipes: dict[str, str] = {}
+        logged: set[str] = set()
+        for entry in self._scan_state_dir():
+            if entry.name.endswith(snapshot_suffix):
+                recipes[entry.name[: -len(snapshot_suffix)]] = entry.path
+            elif entry.name.endswith(_LOG_SUFFIX):
+                logged.add(entry.name[: -len(_LOG_SUFFIX)])
+            elif entry.name.endswith(_COMPACTING_SUFFIX):
+                logged.add(entry.name[: -len(_COMPACTING_SUFFIX)])
+        for recipe_name in logged:
+            recipes.setdefault(
+                recipe_name, os.path.join(self.state_dir, f"{recipe_name}{snapshot_suffix}")
+            )
+
+        for recipe_name, state_path in recipes.items():
             try:
-                state = self.load_processing_state(recipe_name)
+                # Parse the file we just found; only recipes with logged
+                # updates or a damaged file go through load_processing_state
+                state = None
+                if recipe_name not in logged:
+                    try:
+                        with open(state_path, "rb") as f:
+                            state = loads(f.read())
+                    except (OSError, ValueError):
+                        pass
+                if state is None:
+                    state = self.load_processing_state(recipe_name)
+
                 if state:
                     states.append({
                         "recipe_name": recipe_name,
                         "last_updated": state.get("last_updated", "unknown"),
                         "diagram_count": len(state.get("diagrams", {})),
-                        "file_path": str(state_file)
+                        "file_path": state_path
                     })
             except Exception:
                 # Skip corrupted files
@@ -163,15 +365,20 @@ class StateManager:
             Number of files removed
         """
         removed = 0
-        cutoff = datetime.now().timestamp() - (days * 86400)
-
-        for state_file in self.state_dir.glob("*.json"):
-            if state_file.stat().st_mtime < cutoff:
-                try:
-                    state_file.unlink()
+        cutoff_ns = time.time_ns() - days * 86400 * 1_000_000_000
+
+        # DirEntry.stat() reuses metadata from the directory scan where possible
+        for entry in self._scan_state_dir():
+            if not entry.name.endswith(
+                (".json", _LOG_SUFFIX, _COMPACTING_SUFFIX, _SUPERSEDED_SUFFIX)
+            ):
+                continue
+            try:
+                if entry.stat().st_mtime_ns < cutoff_ns:
+                    os.unlink(entry.path)
                     removed += 1
-                except Exception:
-                    pass
+            except OSError:
+                pass
 
         return removed
 
@@ -186,15 +393,16 @@ class StateManager:
         """
         state_file = self.state_dir / f"{recipe_name}.processing.json"
         backup_file = self.state_dir / f"{recipe_name}.processing.backup.json"
+        logs = [
+            self.state_dir / f"{recipe_name}{suffix}"
+            for suffix in (_LOG_SUFFIX, _COMPACTING_SUFFIX, _SUPERSEDED_SUFFIX)
+        ]
 
         found = False
 
-        if state_file.exists():
-            state_file.unlink()
-            found = True
-
-        if backup_file.exists():
-            backup_file.unlink()
-            found = True
+        for path in (state_file, backup_file, *logs):
+            if path.exists():
+                path.unlink()
+                found = True
 
         return found
@@ -6,9 +6,17 @@ from typing import Any, Dict, List, Tuple
 
 import yaml
 
+from t2d_kit.models.base import DiagramType
 from t2d_kit.models.processed_recipe import ProcessedRecipe
 from t2d_kit.models.user_recipe import UserRecipe
 
+from .yaml_io import load_yaml
+
+_MAX_RECIPE_BYTES = 1048576  # 1MB
+
+_VALID_FRAMEWORKS = frozenset({"mermaid", "d2", "plantuml", "auto"})
+_VALID_DIAGRAM_TYPES = frozenset(diagram_type.value for diagram_type in DiagramType)
+
 
 def validate_user_recipe_file(recipe_path: Path) -> tuple[bool, list[str], list[str]]:
     """Validate a user recipe file.
@@ -22,7 +30,10 @@ def validate_user_recipe_file(recipe_path: Path) -> tuple[bool, list[str], list[
     errors = []
     warnings = []
 
-    if not recipe_path.exists():
+    # One stat serves the existence check, the size limits and the parse cache
+    try:
+        stat = recipe_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         errors.append(f"File not found: {recipe_path}")
         return False, errors, warnings
 
@@ -30,9 +41,9 @@ def validate_user_recipe_file(recipe_path: Path) -> tuple[bool, list[str], list[
         errors.append("Recipe file must have .yaml extension")
         return False, errors, warnings
 
-    # Check file size
-    size_bytes = recipe_path.stat().st_size
-    if size_bytes > 1048576:  # 1MB
+    # Check file size; oversized files are rejected without being opened
+    size_bytes = stat.st_size
+    if size_bytes > _MAX_RECIPE_BYTES:
         errors.append(f"Recipe file too large: {size_bytes} bytes (max 1MB)")
         return False, errors, warnings
     elif size_bytes > 524288:  # 512KB
@@ -40,8 +51,7 @@ def validate_user_recipe_file(recipe_path: Path) -> tuple[bool, list[str], list[
 
     # Try to parse YAML
     try:
-        with open(recipe_path) as f:
-            content = yaml.safe_load(f)
+        content = load_yaml(recipe_path, stat, max_bytes=_MAX_RECIPE_BYTES)
     except yaml.YAMLError as e:
         errors.append(f"Invalid YAML: {str(e)}")
         return False, errors, warnings
@@ -54,8 +64,8 @@ def validate_user_recipe_file(recipe_path: Path) -> tuple[bool, list[str], list[
         recipe = UserRecipe.model_validate(content)
 
         # Additional checks
-        if len(recipe.instructions.diagrams) > 20:
-            warnings.append(f"Recipe has {len(recipe.instructions.diagrams)} diagrams (recommended max: 20)")
+        if recipe.diagram_count > 20:
+            warnings.append(f"Recipe has {recipe.diagram_count} diagrams (recommended max: 20)")
 
         if recipe.prd.file_path:
             prd_path = Path(recipe.prd.file_path)
@@ -83,7 +93,9 @@ def validate_processed_recipe_file(recipe_path: Path) -> tuple[bool, list[str],
     errors = []
     warnings = []
 
-    if not recipe_path.exists():
+    try:
+        stat = recipe_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         errors.append(f"File not found: {recipe_path}")
         return False, errors, warnings
 
@@ -92,8 +104,7 @@ def validate_processed_recipe_file(recipe_path: Path) -> tuple[bool, list[str],
 
     # Try to parse YAML
     try:
-        with open(recipe_path) as f:
-            content = yaml.safe_load(f)
+        content = load_yaml(recipe_path, stat)
     except yaml.YAMLError as e:
         errors.append(f"Invalid YAML: {str(e)}")
         return False, errors, warnings
@@ -117,17 +128,16 @@ def validate_processed_recipe_file(recipe_path: Path) -> tuple[bool, list[str],
         if extra_refs:
             errors.append(f"Extra diagram references: {extra_refs}")
 
-        # Check content file references
+        # Check content file references, collecting what is referenced as we go
+        referenced = set()
         for content_file in recipe.content_files:
-            invalid_refs = set(content_file.diagram_refs or []) - spec_ids
+            file_refs = set(content_file.diagram_refs or ())
+            referenced |= file_refs
+            invalid_refs = file_refs - spec_ids
             if invalid_refs:
                 warnings.append(f"Content file '{content_file.path}' references invalid diagrams: {invalid_refs}")
 
         # Check for orphaned diagrams
-        referenced = set()
-        for content_file in recipe.content_files:
-            referenced.update(content_file.diagram_refs or [])
-
         orphaned = spec_ids - referenced
         if orphaned:
             warnings.append(f"Diagrams not referenced by any content: {orphaned}")
@@ -148,10 +158,7 @@ def validate_diagram_type(diagram_type: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    from t2d_kit.mcp.resources.diagram_types import DIAGRAM_TYPES
-
-    valid_types = {dt.type_id for dt in DIAGRAM_TYPES}
-    return diagram_type in valid_types
+    return diagram_type in _VALID_DIAGRAM_TYPES
 
 
 def validate_framework(framework: str) -> bool:
@@ -163,5 +170,5 @@ def validate_framework(framework: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    valid_frameworks = {"mermaid", "d2", "plantuml", "auto"}
-    return framework.lower() in valid_frameworks
+    # Most callers already pass lowercase names, which skips the lower() copy
+    return framework in _VALID_FRAMEWORKS or framework.lower() in _VALID_FRAMEWORKS
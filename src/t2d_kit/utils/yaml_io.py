@@ -0,0 +1,77 @@
+"""YAML loading helpers shared by recipe discovery and validation."""
+
+import copy
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any
+
+import yaml
+
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load(stream: str | bytes | IO) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+
+    Drop-in replacement for ``yaml.safe_load``.
+
+    Args:
+        stream: YAML text, bytes or an open file
+
+    Returns:
+        Parsed YAML document
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML
+    """
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+def load_yaml(
+    path: Path, st: os.stat_result | None = None, max_bytes: int | None = None
+) -> Any:
+    """Parse a YAML file, reusing the previous parse while it is unchanged.
+
+    Parsed documents are cached per (path, mtime, size), so repeated discovery
+    and validation passes over the same recipes skip both the read and the
+    parse. Each call returns its own deep copy of the cached document, so
+    callers may modify it freely.
+
+    Args:
+        path: YAML file to load
+        st: The file's stat result, if the caller already has it
+        max_bytes: Refuse to parse files larger than this. The limit is
+            enforced on the bytes actually read, so a file that grew after
+            ``st`` was taken is still rejected.
+
+    Returns:
+        Parsed YAML document
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the file is larger than ``max_bytes``
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    if st is None:
+        st = path.stat()
+    if max_bytes is not None and st.st_size > max_bytes:
+        raise ValueError(f"{path} is {st.st_size} bytes (max {max_bytes})")
+    document = _load_yaml_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size, max_bytes)
+    return copy.deepcopy(document)
+
+
+@lru_cache(maxsize=512)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int, max_bytes: int | None) -> Any:
+    # mtime_ns and size only key the cache; a rewritten file misses it.
+    # The parser gets the whole file as one buffer rather than a stream.
+    with open(path, "rb") as f:
+        if max_bytes is None:
+            data = f.read()
+        else:
+            # One byte past the limit is enough to detect an oversized file
+            data = f.read(max_bytes + 1)
+            if len(data) > max_bytes:
+                raise ValueError(f"{path} is larger than {max_bytes} bytes")
+    return safe_load(data)
@@ -10,6 +10,7 @@ from unittest.mock import patch
 import yaml
 
 from t2d_kit.models.diagram import DiagramSpecification
+from t2d_kit.models.mkdocs_config import MkDocsPageConfig, dump_nav
 from t2d_kit.models.base import DiagramType, FrameworkType, OutputFormat
 
 
@@ -278,6 +279,22 @@ class TestMkDocsIntegration:
                 assert config["theme"]["palette"]["primary"] == "blue"
                 assert "navigation.tabs" in config["theme"]["features"]
 
+    def test_write_nav_entry(self):
+        """Test serializing generated pages into an mkdocs.yml nav section."""
+        page_config = MkDocsPageConfig(nav_parent="Architecture", pages_subdir="architecture")
+        nav_entry = page_config.create_nav_entry(["system-overview.md", "data-flow.md"])
+
+        nav_yaml = dump_nav(nav_entry)
+
+        # Page order is kept as generated, not sorted
+        assert nav_yaml.index("System Overview") < nav_yaml.index("Data Flow")
+        assert yaml.safe_load(nav_yaml) == {
+            "Architecture": [
+                {"System Overview": "architecture/system-overview.md"},
+                {"Data Flow": "architecture/data-flow.md"},
+            ]
+        }
+
     def test_add_custom_css_and_js(self):
         """Test adding custom CSS and JavaScript to documentation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,102 @@
+"""
+Test D2 layout engine detection and selection.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from t2d_kit.utils import d2_utils
+from t2d_kit.utils.d2_utils import (
+    get_default_layout_for_diagram,
+    is_tala_installed,
+    resolve_layouts,
+)
+
+
+@pytest.fixture
+def tala_cache(tmp_path, monkeypatch):
+    """Point the persisted probe cache at a temp dir and reset the in-process memo."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    d2_utils._cached_tala_status.cache_clear()
+    yield tmp_path / "t2d-kit" / "tala.json"
+    d2_utils._cached_tala_status.cache_clear()
+
+
+class TestTalaDetection:
+    """Test cases for the cached Tala probe."""
+
+    def test_probe_result_is_persisted(self, tala_cache, mocker):
+        """Test that the first probe is written to the cache file."""
+        probe = mocker.patch.object(d2_utils, "_probe_tala", return_value=True)
+
+        assert is_tala_installed() is True
+        assert is_tala_installed() is True
+
+        probe.assert_called_once()
+        assert json.loads(tala_cache.read_text())["installed"] is True
+
+    def test_fresh_cache_skips_probe(self, tala_cache, mocker):
+        """Test that a recent cache file is trusted across processes."""
+        tala_cache.parent.mkdir(parents=True)
+        tala_cache.write_text(json.dumps({"installed": True, "checked_at": time.time()}))
+        probe = mocker.patch.object(d2_utils, "_probe_tala", return_value=False)
+
+        assert is_tala_installed() is True
+        probe.assert_not_called()
+
+    def test_stale_cache_is_reprobed(self, tala_cache, mocker):
+        """Test that a cache file older than the TTL triggers a new probe."""
+        tala_cache.parent.mkdir(parents=True)
+        tala_cache.write_text(json.dumps({"installed": True, "checked_at": 0}))
+        old = time.time() - 2 * 24 * 60 * 60
+        os.utime(tala_cache, (old, old))
+        mocker.patch.object(d2_utils, "_probe_tala", return_value=False)
+
+        assert is_tala_installed() is False
+
+    def test_refresh_ignores_cache(self, tala_cache, mocker):
+        """Test that refresh=True always probes d2 again."""
+        probe = mocker.patch.object(d2_utils, "_probe_tala", side_effect=[False, True])
+
+        assert is_tala_installed() is False
+        assert is_tala_installed(refresh=True) is True
+        assert is_tala_installed() is True
+        assert probe.call_count == 2
+
+
+class TestLayoutSelection:
+    """Test cases for default layout selection."""
+
+    @pytest.mark.parametrize("tala, expected", [(True, "tala"), (False, "elk")])
+    def test_architectural_layouts(self, tala_cache, mocker, tala, expected):
+        """Test that architectural diagrams prefer Tala and fall back to ELK."""
+        mocker.patch.object(d2_utils, "_probe_tala", return_value=tala)
+
+        assert get_default_layout_for_diagram("C4_Container") == expected
+        assert resolve_layouts(["architecture", "flowchart", "deployment"]) == [
+            expected,
+            "dagre",
+            expected,
+        ]
+
+    def test_other_diagrams_use_dagre(self, tala_cache, mocker):
+        """Test that non-architectural diagrams never need the Tala probe."""
+        probe = mocker.patch.object(d2_utils, "_probe_tala", return_value=True)
+
+        assert resolve_layouts(["flowchart", "sequence"]) == ["dagre", "dagre"]
+        probe.assert_not_called()
+
+    def test_batch_checks_tala_once(self, mocker):
+        """Test that a batch asks for Tala availability once, not per diagram."""
+        installed = mocker.patch.object(d2_utils, "is_tala_installed", return_value=False)
+
+        assert resolve_layouts(["c4_context", "architecture", "erd", "deployment"]) == [
+            "elk",
+            "elk",
+            "dagre",
+            "elk",
+        ]
+        installed.assert_called_once()
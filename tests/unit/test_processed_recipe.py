@@ -9,7 +9,12 @@ import pytest
 from t2d_kit.models.base import ContentType, DiagramType, FrameworkType, OutputFormat
 from t2d_kit.models.content import ContentFile
 from t2d_kit.models.diagram import DiagramSpecification
-from t2d_kit.models.processed_recipe import DiagramReference, OutputConfig, ProcessedRecipe
+from t2d_kit.models.processed_recipe import (
+    ActualPaths,
+    DiagramReference,
+    OutputConfig,
+    ProcessedRecipe,
+)
 
 
 class TestProcessedRecipe:
@@ -78,6 +83,7 @@ class TestProcessedRecipe:
         assert processed_recipe.version == "1.0.0"
         assert len(processed_recipe.content_files) == 1
         assert len(processed_recipe.diagram_specs) == 1
+        assert processed_recipe.diagram_count == 1
         assert len(processed_recipe.diagram_refs) == 1
         assert len(processed_recipe.generation_notes) == 2
 
@@ -232,6 +238,47 @@ class TestProcessedRecipe:
         assert len(recreated.diagram_refs) == len(original.diagram_refs)
         assert recreated.generation_notes == original.generation_notes
 
+    def test_diagram_reference_actual_paths(self):
+        """Test that rendered paths are keyed by output format and listed in agent context."""
+        ref = DiagramReference(
+            id="arch-diagram",
+            title="System Architecture",
+            type=DiagramType.ARCHITECTURE,
+            expected_path="diagrams/architecture.d2",
+            status="generated",
+            actual_paths={"svg": "assets/architecture.svg", "png": "assets/architecture.png"},
+        )
+
+        assert ref.actual_paths.svg == "assets/architecture.svg"
+        assert ref.actual_paths.pdf is None
+
+        context = self.create_valid_content_file().format_diagram_context([ref])
+        assert "  - SVG: assets/architecture.svg" in context
+        assert "  - PNG: assets/architecture.png" in context
+        assert "PDF" not in context
+
+        with pytest.raises(ValueError):
+            DiagramReference(
+                id="arch-diagram",
+                title="System Architecture",
+                type=DiagramType.ARCHITECTURE,
+                expected_path="diagrams/architecture.d2",
+                actual_paths={"gif": "assets/architecture.gif"},
+            )
+
+        # Recipes written with an inline entry still load
+        inline_ref = DiagramReference.model_validate(
+            {**ref.model_dump(), "actual_paths": {"inline": "<svg/>"}}
+        )
+        assert inline_ref.actual_paths.inline == "<svg/>"
+        assert inline_ref.actual_paths.has_any()
+
+        # An empty paths object counts as not rendered yet
+        empty_ref = ref.model_copy(update={"actual_paths": ActualPaths()})
+        assert not empty_ref.actual_paths.has_any()
+        context = self.create_valid_content_file().format_diagram_context([empty_ref])
+        assert context == "- arch-diagram: System Architecture (Status: generated)"
+
     def test_processed_recipe_from_user_recipe(self):
         """Test creating ProcessedRecipe from UserRecipe with proper timezone handling."""
         from t2d_kit.models.user_recipe import (
@@ -0,0 +1,40 @@
+"""Test recipe discovery helpers."""
+
+from t2d_kit.utils.recipe_discovery import discover_user_recipes, find_recipe_by_name
+
+
+def test_discover_user_recipes(tmp_path):
+    """Test listing user recipes with and without parsing them."""
+    (tmp_path / "good.yaml").write_text("name: good\ninstructions:\n  diagrams: []\n")
+    (tmp_path / "partial.yaml").write_text("name: partial\n")
+    (tmp_path / "broken.yaml").write_text("name: [unclosed\n")
+    (tmp_path / "done.t2d.yaml").write_text("name: done\n")
+    (tmp_path / "notes.txt").write_text("not a recipe")
+
+    recipes = discover_user_recipes(tmp_path)
+    assert [(r["name"], r["valid"]) for r in recipes] == [("good", True), ("partial", False)]
+
+    # Metadata-only listing doesn't parse, so unparsable files are listed too
+    listed = discover_user_recipes(tmp_path, validate=False)
+    assert [r["name"] for r in listed] == ["broken", "good", "partial"]
+    assert all(r["valid"] is None for r in listed)
+    assert listed[1]["path"] == str(tmp_path / "good.yaml")
+    assert listed[1]["size_bytes"] == (tmp_path / "good.yaml").stat().st_size
+
+
+def test_discover_user_recipes_missing_dir(tmp_path):
+    """Test that a missing recipe directory yields no recipes."""
+    assert discover_user_recipes(tmp_path / "missing") == []
+
+
+def test_find_recipe_by_name(tmp_path):
+    """Test exact and case-insensitive lookups, including newly added files."""
+    (tmp_path / "Payment-System.yaml").write_text("name: Payment-System\n")
+
+    assert find_recipe_by_name("Payment-System", tmp_path) == tmp_path / "Payment-System.yaml"
+    assert find_recipe_by_name("payment-system", tmp_path) == tmp_path / "Payment-System.yaml"
+    assert find_recipe_by_name("user-auth", tmp_path) is None
+
+    (tmp_path / "User-Auth.yaml").write_text("name: User-Auth\n")
+    assert find_recipe_by_name("USER-AUTH", tmp_path) == tmp_path / "User-Auth.yaml"
+    assert find_recipe_by_name("anything", tmp_path / "missing") is None
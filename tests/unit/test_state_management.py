@@ -0,0 +1,130 @@
+"""Test processing state management with logged diagram status updates."""
+
+import json
+import shutil
+
+import pytest
+
+from t2d_kit.utils import state_management
+from t2d_kit.utils.state_management import StateManager
+
+
+def test_update_diagram_status_appends_to_log(tmp_path):
+    """Test that status updates are logged and folded into loaded state."""
+    manager = StateManager(tmp_path)
+    manager.save_processing_state("recipe", {"diagrams": {}, "phase": "generating"})
+
+    manager.update_diagram_status("recipe", "flow", "processing")
+    manager.update_diagram_status("recipe", "flow", "complete", message="done")
+    manager.update_diagram_status("recipe", "seq", "failed")
+
+    log_lines = (tmp_path / "recipe.processing.log").read_text().splitlines()
+    assert [json.loads(line)["s"] for line in log_lines] == ["processing", "complete", "failed"]
+
+    state = manager.load_processing_state("recipe")
+    assert state["phase"] == "generating"
+    assert state["diagrams"]["flow"]["status"] == "complete"
+    assert state["diagrams"]["flow"]["message"] == "done"
+    assert manager.get_diagram_status("recipe", "seq")["status"] == "failed"
+    assert state["last_updated"] == state["diagrams"]["seq"]["updated_at"]
+
+
+def test_loading_and_listing_never_write(tmp_path):
+    """Test that reads leave the log alone and skip records missing fields."""
+    manager = StateManager(tmp_path)
+    log_file = tmp_path / "recipe.processing.log"
+    for i in range(20):
+        manager.update_diagram_status("recipe", f"diagram-{i}", "complete")
+    with open(log_file, "a") as f:
+        f.write('{"t": "2026-01-01T00:00:00", "d": "no-status"}\n[1, 2]\n')
+    log = log_file.read_bytes()
+
+    assert len(manager.load_processing_state("recipe")["diagrams"]) == 20
+    assert manager.list_processing_states()[0]["diagram_count"] == 20
+    assert log_file.read_bytes() == log
+    assert not (tmp_path / "recipe.processing.json").exists()
+
+
+def test_compact_processing_state(tmp_path, monkeypatch):
+    """Test that compaction folds the log into the snapshot and keeps later updates."""
+    manager = StateManager(tmp_path)
+    for i in range(20):
+        manager.update_diagram_status("recipe", f"diagram-{i}", "complete")
+
+    assert manager.compact_processing_state("recipe")
+    assert not manager.compact_processing_state("recipe")
+    assert not (tmp_path / "recipe.processing.log").exists()
+    snapshot = json.loads((tmp_path / "recipe.processing.json").read_text())
+    assert snapshot == manager.load_processing_state("recipe")
+
+    # An interrupted compaction is still replayed, and a later one finishes it
+    manager.update_diagram_status("recipe", "diagram-0", "failed")
+    (tmp_path / "recipe.processing.log").rename(tmp_path / "recipe.processing.log.compacting")
+    manager.update_diagram_status("recipe", "diagram-1", "failed")
+    state = manager.load_processing_state("recipe")
+    assert state["diagrams"]["diagram-0"]["status"] == "failed"
+    assert state["diagrams"]["diagram-1"]["status"] == "failed"
+    assert manager.compact_processing_state("recipe")
+    assert manager.load_processing_state("recipe") == state
+
+    # Writers compact on their own once the log outgrows the snapshot
+    monkeypatch.setattr(state_management, "_MIN_COMPACT_LOG_BYTES", 0)
+    manager.update_diagram_status("fresh", "flow", "complete")
+    assert not (tmp_path / "fresh.processing.log").exists()
+    snapshot = json.loads((tmp_path / "fresh.processing.json").read_text())
+    assert snapshot["diagrams"]["flow"]["status"] == "complete"
+
+
+def test_list_and_clear_logged_only_state(tmp_path):
+    """Test that a recipe with only logged updates is listed and cleared."""
+    manager = StateManager(tmp_path)
+    manager.save_processing_state("snapshot-only", {"diagrams": {"a": {"status": "complete"}}})
+    # Write the log directly so listing has to fold it
+    (tmp_path / "logged.processing.log").write_text(
+        '{"t": "2026-01-01T00:00:00", "d": "flow", "s": "pending"}\n{"t": "2026-01-01T00:00'
+    )
+
+    summaries = {s["recipe_name"]: s for s in manager.list_processing_states()}
+    assert summaries["snapshot-only"]["diagram_count"] == 1
+    assert summaries["logged"]["diagram_count"] == 1
+    assert summaries["logged"]["last_updated"] == "2026-01-01T00:00:00"
+
+    assert manager.clear_state("logged")
+    assert manager.load_processing_state("logged") is None
+
+
+def test_writes_recreate_a_deleted_state_dir(tmp_path):
+    """Test that a manager keeps working after its state dir is removed."""
+    state_dir = tmp_path / "state"
+    manager = StateManager(state_dir)
+    state_dir.rmdir()
+
+    manager.update_diagram_status("recipe", "flow", "complete")
+    shutil.rmtree(state_dir)
+    manager.save_processing_state("recipe", {"diagrams": {}})
+
+    assert StateManager(state_dir).load_processing_state("recipe")["diagrams"] == {}
+
+
+def test_failed_save_keeps_logged_updates(tmp_path, mocker):
+    """Test that logged updates are put back when the snapshot write fails."""
+    manager = StateManager(tmp_path)
+    manager.update_diagram_status("recipe", "a", "complete")
+
+    mocker.patch.object(manager, "_write_snapshot", side_effect=OSError("disk full"))
+    with pytest.raises(OSError):
+        manager.save_processing_state("recipe", {"diagrams": {}})
+
+    assert not (tmp_path / "recipe.processing.log.superseded").exists()
+    assert manager.load_processing_state("recipe")["diagrams"]["a"]["status"] == "complete"
+
+
+def test_scans_of_a_deleted_state_dir_are_empty(tmp_path):
+    """Test that listing and cleanup treat a removed state dir as empty."""
+    state_dir = tmp_path / "state"
+    manager = StateManager(state_dir)
+    manager.save_processing_state("recipe", {"diagrams": {}})
+    shutil.rmtree(state_dir)
+
+    assert manager.list_processing_states() == []
+    assert manager.cleanup_old_states(days=0) == 0
@@ -1,12 +1,14 @@
 """T011: Test StateManager for file-based state coordination between agents."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
 import pytest
 
+from t2d_kit.models import state as state_module
 from t2d_kit.models.state import StateManager
 
 
@@ -50,6 +52,71 @@ class TestStateManager:
         retrieved_data = state_manager.read_state("test_key")
         assert retrieved_data == test_data
 
+    def test_write_states_batch(self, tmp_path):
+        """Test writing several states in one call."""
+        state_dir = tmp_path / "test_state"
+        state_manager = StateManager(state_dir=state_dir)
+        state_manager.write_state("agent1", {"status": "pending"})
+        state_manager.read_state("agent1")
+
+        batch = {"agent1": {"status": "complete"}, "agent2": {"status": "running"}}
+        state_manager.write_states_batch(batch)
+
+        assert set(state_manager.list_states()) == {"agent1", "agent2"}
+        for key, data in batch.items():
+            assert state_manager.read_state(key) == data
+
+    def test_concurrent_writes_from_threads(self, tmp_path):
+        """Test that threads writing the same state never share a temp file."""
+        state_dir = tmp_path / "test_state"
+        state_manager = StateManager(state_dir=state_dir)
+
+        def write(i):
+            state_manager.write_state("shared", {"writer": i, "payload": "x" * 10_000})
+            state_manager.write_state_with_backup("backed-up", {"writer": i})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(32)))
+
+        assert state_manager.read_state("shared")["payload"] == "x" * 10_000
+        assert state_manager.read_state("backed-up")["writer"] in range(32)
+        assert not list(state_dir.glob(".*.tmp"))
+
+    def test_read_states(self, tmp_path):
+        """Test reading several states at once, including a missing one."""
+        state_dir = tmp_path / "test_state"
+        state_manager = StateManager(state_dir=state_dir)
+        for key in ("agent1", "agent2", "agent3"):
+            state_manager.write_state(key, {"agent": key})
+
+        states = state_manager.read_states(["agent3", "missing", "agent1"])
+
+        assert list(states) == ["agent3", "missing", "agent1"]
+        assert states["agent1"] == {"agent": "agent1"}
+        assert states["agent3"] == {"agent": "agent3"}
+        assert states["missing"] is None
+
+    def test_read_state_cache(self, tmp_path, mocker):
+        """Test that unchanged state is parsed once, copied per caller, and refreshed."""
+        state_dir = tmp_path / "test_state"
+        state_manager = StateManager(state_dir=state_dir)
+        state_manager.write_state("cached", {"step": 1})
+
+        # Each caller gets its own dict; mutating one doesn't leak into later reads
+        parse = mocker.spy(state_module, "loads")
+        first = state_manager.read_state("cached")
+        first["step"] = 99
+        assert state_manager.read_state("cached") == {"step": 1}
+        parse.assert_called_once()
+
+        # Another agent rewrites the file directly
+        state_file = state_dir / "cached.json"
+        state_file.write_text(json.dumps({"step": 22}))
+        assert state_manager.read_state("cached") == {"step": 22}
+
+        state_file.unlink()
+        assert state_manager.read_state("cached") is None
+
     def test_read_nonexistent_state(self, tmp_path):
         """Test reading state that doesn't exist returns None."""
         state_dir = tmp_path / "test_state"
@@ -0,0 +1,65 @@
+"""Test the processing and coordination state models."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+from t2d_kit.models.state import (
+    AgentCoordinationState,
+    ContentGenerationState,
+    ProcessingState,
+)
+
+
+def test_processing_state_deduplicates_after_direct_changes():
+    """Test duplicate checks stay correct when the lists are changed directly."""
+    state = ProcessingState(recipe_path=Path("recipe.yaml"), started_at=datetime.now(UTC))
+    state.add_completed_diagram("flow-001")
+    state.diagrams_completed.append("erd-001")
+    state.add_completed_diagram("erd-001")
+    assert state.diagrams_completed == ["flow-001", "erd-001"]
+
+    copy = state.model_copy(update={"diagrams_completed": ["seq-001"]})
+    copy.add_completed_diagram("flow-001")
+    assert copy.diagrams_completed == ["seq-001", "flow-001"]
+    state.add_completed_diagram("seq-001")
+    assert state.diagrams_completed == ["flow-001", "erd-001", "seq-001"]
+
+    # Swapping one entry for another keeps the length but must not go stale
+    state.diagrams_completed[0] = "class-001"
+    state.add_completed_diagram("flow-001")
+    assert state.diagrams_completed == ["class-001", "erd-001", "seq-001", "flow-001"]
+
+    state.content_files_created.append(Path("docs/index.md"))
+    state.add_content_file(Path("docs/index.md"))
+    assert state.content_files_created == [Path("docs/index.md")]
+
+
+def test_content_generation_state_deduplicates_after_direct_changes():
+    """Test add_diagram notices diagrams appended without it."""
+    state = ContentGenerationState(content_type="documentation")
+    state.diagrams_found.append(Path("flow.svg"))
+    state.add_diagram(Path("flow.svg"))
+    state.add_diagram(Path("erd.svg"))
+    assert state.diagrams_found == [Path("flow.svg"), Path("erd.svg")]
+
+
+def test_agent_coordination_sees_direct_field_changes():
+    """Test readiness follows the public fields, however they were changed."""
+    state = AgentCoordinationState(recipe_name="test-system")
+    state.register_agent("transform")
+    state.register_agent("d2")
+    state.set_dependencies("d2", ["transform"])
+    assert state.get_ready_agents() == ["transform"]
+
+    state.agents_working["transform"] = "complete"
+    assert state.can_agent_start("d2")
+    assert state.get_ready_agents() == ["d2"]
+
+    state.dependencies["d2"].append("mermaid")
+    assert not state.can_agent_start("d2")
+    assert not state.is_all_complete()
+
+    copy = state.model_copy(deep=True)
+    copy.update_agent_status("d2", "complete")
+    assert copy.is_all_complete()
+    assert not state.is_all_complete()
@@ -39,6 +39,7 @@ class TestUserRecipe:
         assert recipe.version == "1.0.0"
         assert recipe.prd.content == "# Product Requirements\n\nThis is a basic data flow diagram system."
         assert len(recipe.instructions.diagrams) == 2
+        assert recipe.diagram_count == 2
         assert recipe.instructions.diagrams[0].type == "system_architecture"
         assert recipe.instructions.diagrams[1].type == "data_flow"
 
@@ -110,6 +111,7 @@ class TestUserRecipe:
         assert result["prd"]["content"] == "Test PRD content"
         assert len(result["instructions"]["diagrams"]) == 1
         assert result["instructions"]["diagrams"][0]["type"] == "flowchart"
+        assert "diagram_count" not in result  # derived, so never serialized
 
     def test_user_recipe_with_file_path_prd(self):
         """Test that UserRecipe can be created with PRD file path instead of content."""
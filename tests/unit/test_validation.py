@@ -0,0 +1,43 @@
+"""Test recipe validation helpers."""
+
+from t2d_kit.utils.validation import (
+    validate_diagram_type,
+    validate_framework,
+    validate_user_recipe_file,
+)
+
+
+def test_validate_diagram_type():
+    """Test that known diagram types are accepted and others rejected."""
+    assert validate_diagram_type("sequence")
+    assert validate_diagram_type("c4_container")
+    assert validate_diagram_type("plantuml_usecase")
+    assert not validate_diagram_type("not_a_diagram")
+    assert not validate_diagram_type("")
+
+
+def test_validate_framework():
+    """Test that framework names are matched case-insensitively."""
+    assert validate_framework("d2")
+    assert validate_framework("Mermaid")
+    assert validate_framework("PLANTUML")
+    assert not validate_framework("graphviz")
+
+
+def test_validate_user_recipe_file_errors(tmp_path):
+    """Test the file-level checks that run before model validation."""
+    valid, errors, _ = validate_user_recipe_file(tmp_path / "missing.yaml")
+    assert not valid
+    assert errors == [f"File not found: {tmp_path / 'missing.yaml'}"]
+
+    wrong_suffix = tmp_path / "recipe.yml"
+    wrong_suffix.write_text("name: recipe\n")
+    valid, errors, _ = validate_user_recipe_file(wrong_suffix)
+    assert not valid
+    assert errors == ["Recipe file must have .yaml extension"]
+
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("name: [unclosed\n")
+    valid, errors, _ = validate_user_recipe_file(broken)
+    assert not valid
+    assert errors[0].startswith("Invalid YAML")
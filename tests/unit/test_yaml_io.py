@@ -0,0 +1,71 @@
+"""Test the cached YAML loader used by recipe discovery and validation."""
+
+import os
+
+import pytest
+import yaml
+
+from t2d_kit.utils import yaml_io
+from t2d_kit.utils.yaml_io import load_yaml
+
+
+def test_load_yaml_reuses_unchanged_parse(tmp_path):
+    """Test that an unchanged file is parsed once and a rewrite is picked up."""
+    recipe_file = tmp_path / "recipe.yaml"
+    recipe_file.write_text("name: first\n")
+
+    first = load_yaml(recipe_file)
+    assert first == {"name": "first"}
+    assert load_yaml(recipe_file) == first
+
+    recipe_file.write_text("name: second-version\n")
+    assert load_yaml(recipe_file) == {"name": "second-version"}
+
+    # Same size, but a newer mtime still invalidates the cached parse
+    recipe_file.write_text("name: third-version\n")
+    st = recipe_file.stat()
+    os.utime(recipe_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_yaml(recipe_file) == {"name": "third-version"}
+
+
+def test_load_yaml_returns_private_copies(tmp_path, mocker):
+    """Test that mutating a loaded document doesn't change later loads."""
+    recipe_file = tmp_path / "recipe.yaml"
+    recipe_file.write_text("name: recipe\ninstructions:\n  diagrams: [flowchart]\n")
+
+    parse = mocker.spy(yaml_io, "safe_load")
+    first = load_yaml(recipe_file)
+    first["name"] = "changed"
+    first["instructions"]["diagrams"].append("erd")
+
+    assert load_yaml(recipe_file) == {"name": "recipe", "instructions": {"diagrams": ["flowchart"]}}
+    parse.assert_called_once()
+
+
+def test_load_yaml_errors_are_not_cached(tmp_path):
+    """Test that invalid YAML raises and a fixed file then loads."""
+    recipe_file = tmp_path / "broken.yaml"
+    recipe_file.write_text("name: [unclosed\n")
+
+    with pytest.raises(yaml.YAMLError):
+        load_yaml(recipe_file)
+
+    recipe_file.write_text("name: fixed\n")
+    assert load_yaml(recipe_file) == {"name": "fixed"}
+
+
+def test_load_yaml_max_bytes(tmp_path):
+    """Test that files over the size limit are rejected before parsing."""
+    recipe_file = tmp_path / "big.yaml"
+    recipe_file.write_text("name: " + "x" * 100 + "\n")
+
+    with pytest.raises(ValueError):
+        load_yaml(recipe_file, max_bytes=50)
+
+    # A stale stat taken while the file was small doesn't bypass the limit
+    small_stat = recipe_file.stat()
+    recipe_file.write_text("name: " + "x" * 200 + "\n")
+    with pytest.raises(ValueError):
+        load_yaml(recipe_file, small_stat, max_bytes=150)
+
+    assert load_yaml(recipe_file, max_bytes=1000) == {"name": "x" * 200}